@@ -58,6 +58,7 @@ setup(
             "*.png",
             "*.jpg",
             "*.svg",
+            "data/*.json",
         ]
     },
 
@@ -6,10 +6,14 @@ Provides 30m and 90m resolution elevation data globally.
 """
 
 import os
+import shutil
+import asyncio
 import tempfile
+import email.utils
 import requests
 import numpy as np
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import Tuple, Optional, Callable
 from zipfile import ZipFile
@@ -42,6 +46,68 @@ except ImportError:
     GDAL_AVAILABLE = False
     logger.warning("GDAL is not available")
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _mask_and_cast_kernel(src, no_data, out):
+        """Write src into float32 out, with no_data replaced by NaN."""
+        for i in prange(src.shape[0]):
+            for j in range(src.shape[1]):
+                v = src[i, j]
+                if v == no_data:
+                    out[i, j] = np.nan
+                else:
+                    out[i, j] = v
+
+
+def _nodata_to_nan(elevation: np.ndarray, no_data: Optional[float]) -> np.ndarray:
+    """
+    Convert raw tile data to float32 with no-data values set to NaN.
+
+    Uses a single fused pass when numba is available, otherwise a NumPy
+    cast followed by an in-place masked assignment.
+
+    Args:
+        elevation: Raw elevation array as read from GDAL
+        no_data: Band no-data value, or None
+
+    Returns:
+        numpy.ndarray: float32 elevation data
+    """
+    if no_data is None:
+        return elevation.astype(np.float32)
+
+    if NUMBA_AVAILABLE and elevation.ndim == 2:
+        out = np.empty(elevation.shape, dtype=np.float32)
+        _mask_and_cast_kernel(elevation, no_data, out)
+        return out
+
+    out = elevation.astype(np.float32)
+    out[elevation == no_data] = np.nan
+    return out
+
+
+def _in_event_loop() -> bool:
+    """Return True if called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
 
 class SRTMFetcher:
     """
@@ -55,6 +121,12 @@ class SRTMFetcher:
     # Public SRTM data sources
     SRTM_BASE_URL = "https://srtm.csi.cgiar.org/wp-content/uploads/files/srtm_5x5/TIFF/"
 
+    # Maximum number of open tile datasets kept between queries
+    DATASET_CACHE_SIZE = 16
+
+    # Merged mosaics larger than this (in pixels) are memory-mapped from disk
+    MEMMAP_THRESHOLD_PIXELS = 4096 * 4096
+
     def __init__(self, cache_dir: Optional[str] = None):
         """
         Initialize SRTM fetcher.
@@ -81,6 +153,9 @@ class SRTMFetcher:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"SRTM cache directory: {self.cache_dir}")
 
+            # Open GDAL datasets keyed by tile path (LRU order)
+            self._ds_cache: "OrderedDict[str, gdal.Dataset]" = OrderedDict()
+
         except PermissionError as e:
             logger.error(f"Cannot create cache directory: {e}")
             raise DataFetchError(
@@ -98,7 +173,8 @@ class SRTMFetcher:
         self,
         bbox: Tuple[float, float, float, float],
         resolution: int = 30,
-        progress_callback: Optional[Callable[[str, int], None]] = None
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        revalidate: bool = False
     ) -> np.ndarray:
         """
         Fetch elevation data for a bounding box.
@@ -107,6 +183,8 @@ class SRTMFetcher:
             bbox: Bounding box as (min_lon, min_lat, max_lon, max_lat)
             resolution: Target resolution in meters (30 or 90)
             progress_callback: Optional callback function(message, percent)
+            revalidate: Check cached tiles with the server (If-Modified-Since)
+                        and re-download only those that changed
 
         Returns:
             numpy.ndarray: Elevation data in meters (2D array)
@@ -137,25 +215,14 @@ class SRTMFetcher:
             if progress_callback:
                 progress_callback(f"Need to fetch {len(tiles)} tile(s)", 10)
 
-            # Download and cache tiles
-            tile_files = []
-            failed_tiles = []
-
-            for i, tile_id in enumerate(tiles):
-                percent = 10 + int((i / len(tiles)) * 70)
-
-                if progress_callback:
-                    progress_callback(f"Downloading tile {i+1}/{len(tiles)}: {tile_id}", percent)
-
-                try:
-                    tile_file = self._fetch_tile(tile_id)
-                    tile_files.append(tile_file)
-                    logger.debug(f"Successfully fetched tile: {tile_id}")
-
-                except Exception as e:
-                    logger.warning(f"Failed to fetch tile {tile_id}: {e}")
-                    failed_tiles.append((tile_id, str(e)))
-                    # Continue with other tiles
+            # Download and cache tiles (concurrently when aiohttp is available
+            # and we are not already inside a running event loop)
+            if AIOHTTP_AVAILABLE and not _in_event_loop():
+                tile_files, failed_tiles = asyncio.run(
+                    self._fetch_tiles_async(tiles, progress_callback, revalidate)
+                )
+            else:
+                tile_files, failed_tiles = self._fetch_tiles(tiles, progress_callback, revalidate)
 
             # Check if we got at least some tiles
             if not tile_files:
@@ -209,6 +276,94 @@ class SRTMFetcher:
                 user_message=f"Failed to fetch elevation data: {str(e)}"
             )
 
+    def _fetch_tiles(
+        self,
+        tiles: list,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        revalidate: bool = False
+    ) -> Tuple[list, list]:
+        """
+        Fetch tiles one after another.
+
+        Args:
+            tiles: List of tile IDs
+            progress_callback: Optional progress callback(message, percent)
+            revalidate: Revalidate cached tiles with the server
+
+        Returns:
+            tuple: (tile_files, failed_tiles) where failed_tiles holds
+                   (tile_id, error message) pairs
+        """
+        tile_files = []
+        failed_tiles = []
+
+        for i, tile_id in enumerate(tiles):
+            percent = 10 + int((i / len(tiles)) * 70)
+
+            if progress_callback:
+                progress_callback(f"Downloading tile {i+1}/{len(tiles)}: {tile_id}", percent)
+
+            try:
+                tile_file = self._fetch_tile(tile_id, revalidate)
+                tile_files.append(tile_file)
+                logger.debug(f"Successfully fetched tile: {tile_id}")
+
+            except Exception as e:
+                logger.warning(f"Failed to fetch tile {tile_id}: {e}")
+                failed_tiles.append((tile_id, str(e)))
+                # Continue with other tiles
+
+        return tile_files, failed_tiles
+
+    async def _fetch_tiles_async(
+        self,
+        tiles: list,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        revalidate: bool = False
+    ) -> Tuple[list, list]:
+        """
+        Fetch tiles concurrently over a shared aiohttp session.
+
+        Args:
+            tiles: List of tile IDs
+            progress_callback: Optional progress callback(message, percent)
+            revalidate: Revalidate cached tiles with the server
+
+        Returns:
+            tuple: (tile_files, failed_tiles), in the same order as tiles
+        """
+        completed = 0
+
+        async def fetch(session, tile_id):
+            nonlocal completed
+            try:
+                return await self._fetch_tile_async(session, tile_id, revalidate)
+            finally:
+                completed += 1
+                if progress_callback:
+                    percent = 10 + int((completed / len(tiles)) * 70)
+                    progress_callback(f"Downloaded tile {completed}/{len(tiles)}: {tile_id}", percent)
+
+        timeout = aiohttp.ClientTimeout(total=60)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(fetch(session, tile_id) for tile_id in tiles),
+                return_exceptions=True
+            )
+
+        tile_files = []
+        failed_tiles = []
+
+        for tile_id, result in zip(tiles, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch tile {tile_id}: {result}")
+                failed_tiles.append((tile_id, str(result)))
+            else:
+                tile_files.append(result)
+                logger.debug(f"Successfully fetched tile: {tile_id}")
+
+        return tile_files, failed_tiles
+
     def _get_required_tiles(self, bbox: Tuple[float, float, float, float]) -> list:
         """
         Determine which SRTM tiles are needed for the bounding box.
@@ -248,12 +403,14 @@ class SRTMFetcher:
         backoff=2.0,
         exceptions=(NetworkError,)
     )
-    def _fetch_tile(self, tile_id: str) -> Path:
+    def _fetch_tile(self, tile_id: str, revalidate: bool = False) -> Path:
         """
         Fetch a single SRTM tile, using cache if available.
 
         Args:
             tile_id: Tile identifier (e.g., "srtm_12_04")
+            revalidate: If the tile is cached, ask the server whether it
+                        changed since the cached copy (304 keeps the cache)
 
         Returns:
             Path: Path to the cached tile file
@@ -265,7 +422,7 @@ class SRTMFetcher:
         # Check cache first
         cache_file = self.cache_dir / f"{tile_id}.tif"
 
-        if cache_file.exists():
+        if cache_file.exists() and not revalidate:
             logger.debug(f"Using cached tile: {tile_id}")
             return cache_file
 
@@ -278,9 +435,16 @@ class SRTMFetcher:
             response = handle_network_error(
                 requests.get,
                 url,
+                headers=self._conditional_headers(cache_file),
                 timeout=60,
                 stream=True
             )
+
+            if response.status_code == 304:
+                response.close()
+                logger.debug(f"Cached tile is up to date: {tile_id}")
+                return cache_file
+
             response.raise_for_status()
 
             # Save zip file temporarily
@@ -299,37 +463,8 @@ class SRTMFetcher:
             logger.debug(f"Downloaded {downloaded} bytes for tile {tile_id}")
 
             # Extract TIFF from zip
-            try:
-                with ZipFile(zip_path, 'r') as zip_ref:
-                    # Find the .tif file in the zip
-                    tif_files = [f for f in zip_ref.namelist() if f.endswith('.tif')]
-
-                    if not tif_files:
-                        raise DataFetchError(
-                            f"No TIFF file found in {tile_id}.zip",
-                            user_message=f"Downloaded tile {tile_id} is corrupted (no TIFF file found)."
-                        )
-
-                    # Extract to cache directory
-                    zip_ref.extract(tif_files[0], self.cache_dir)
-
-                    # Rename to standard name
-                    extracted_file = self.cache_dir / tif_files[0]
-                    extracted_file.rename(cache_file)
-
-                logger.debug(f"Extracted tile {tile_id} successfully")
-
-            except Exception as e:
-                logger.error(f"Failed to extract tile {tile_id}: {e}")
-                raise DataFetchError(
-                    f"Failed to extract SRTM tile {tile_id}: {e}",
-                    user_message=f"Downloaded tile {tile_id} appears to be corrupted."
-                )
-
-            finally:
-                # Clean up zip file
-                if zip_path.exists():
-                    zip_path.unlink()
+            self._extract_tile(zip_path, tile_id, cache_file)
+            self._apply_last_modified(cache_file, response.headers.get('Last-Modified'))
 
             return cache_file
 
@@ -351,6 +486,185 @@ class SRTMFetcher:
                 user_message=f"Unexpected error downloading elevation data."
             )
 
+    def _extract_tile(self, zip_path: Path, tile_id: str, cache_file: Path) -> Path:
+        """
+        Extract the tile TIFF from a downloaded zip and remove the zip.
+
+        Args:
+            zip_path: Path to the downloaded zip file
+            tile_id: Tile identifier
+            cache_file: Final path for the extracted tile
+
+        Returns:
+            Path: Path to the cached tile file
+
+        Raises:
+            DataFetchError: If tile extraction fails
+        """
+        writing = False
+
+        try:
+            with ZipFile(zip_path, 'r') as zip_ref:
+                # Find the first .tif file in the zip
+                tif_info = next(
+                    (info for info in zip_ref.infolist() if info.filename.endswith('.tif')),
+                    None
+                )
+
+                if tif_info is None:
+                    raise DataFetchError(
+                        f"No TIFF file found in {tile_id}.zip",
+                        user_message=f"Downloaded tile {tile_id} is corrupted (no TIFF file found)."
+                    )
+
+                # Drop any open handle on a tile being replaced
+                self._ds_cache.pop(str(cache_file.resolve()), None)
+
+                # Stream straight to the standard name (no nested dirs or rename)
+                writing = True
+                with zip_ref.open(tif_info) as src, open(cache_file, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+
+            logger.debug(f"Extracted tile {tile_id} successfully")
+
+        except Exception as e:
+            logger.error(f"Failed to extract tile {tile_id}: {e}")
+
+            # Don't leave a partial tile behind to be picked up as cached
+            if writing and cache_file.exists():
+                cache_file.unlink()
+
+            raise DataFetchError(
+                f"Failed to extract SRTM tile {tile_id}: {e}",
+                user_message=f"Downloaded tile {tile_id} appears to be corrupted."
+            )
+
+        finally:
+            # Clean up zip file
+            if zip_path.exists():
+                zip_path.unlink()
+
+        return cache_file
+
+    async def _fetch_tile_async(self, session, tile_id: str, revalidate: bool = False) -> Path:
+        """
+        Fetch a single SRTM tile with aiohttp, using cache if available.
+
+        Async counterpart of _fetch_tile. Retries connection errors, timeouts
+        and 5xx responses with the same schedule as _fetch_tile; 4xx
+        responses fail at once. Extraction runs in the default executor so
+        it doesn't block the event loop.
+
+        Args:
+            session: Open aiohttp.ClientSession
+            tile_id: Tile identifier (e.g., "srtm_12_04")
+            revalidate: Revalidate a cached tile with If-Modified-Since
+
+        Returns:
+            Path: Path to the cached tile file
+
+        Raises:
+            NetworkError: If download fails after retries
+            DataFetchError: If tile extraction fails
+        """
+        cache_file = self.cache_dir / f"{tile_id}.tif"
+
+        if cache_file.exists() and not revalidate:
+            logger.debug(f"Using cached tile: {tile_id}")
+            return cache_file
+
+        url = f"{self.SRTM_BASE_URL}{tile_id}.zip"
+        zip_path = self.cache_dir / f"{tile_id}.zip"
+        headers = self._conditional_headers(cache_file)
+
+        max_attempts = 3
+        delay = 2.0
+
+        for attempt in range(1, max_attempts + 1):
+            logger.info(f"Downloading SRTM tile from: {url}")
+            try:
+                downloaded = 0
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        logger.debug(f"Cached tile is up to date: {tile_id}")
+                        return cache_file
+
+                    response.raise_for_status()
+                    last_modified = response.headers.get('Last-Modified')
+                    with open(zip_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(1 << 20):
+                            f.write(chunk)
+                            downloaded += len(chunk)
+
+                logger.debug(f"Downloaded {downloaded} bytes for tile {tile_id}")
+                break
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Client errors (e.g. 404 for ocean or void tiles) won't
+                # change on a retry; only connection errors, timeouts and
+                # 5xx responses are retried
+                client_error = isinstance(e, aiohttp.ClientResponseError) and e.status < 500
+                if attempt == max_attempts or client_error:
+                    logger.error(f"Network error downloading tile {tile_id}: {e}")
+                    raise NetworkError(
+                        f"Failed to download SRTM tile {tile_id}: {e}",
+                        user_message=f"Network error downloading elevation tile. Check your connection."
+                    )
+
+                logger.warning(
+                    f"_fetch_tile_async failed (attempt {attempt}/{max_attempts}): {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+                delay *= 2.0
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._extract_tile, zip_path, tile_id, cache_file)
+        self._apply_last_modified(cache_file, last_modified)
+
+        return cache_file
+
+    @staticmethod
+    def _conditional_headers(cache_file: Path) -> dict:
+        """
+        Build If-Modified-Since headers for a cached tile.
+
+        Args:
+            cache_file: Path to the cached tile file
+
+        Returns:
+            dict: Request headers (empty if the tile isn't cached)
+        """
+        if not cache_file.exists():
+            return {}
+
+        return {
+            'If-Modified-Since': email.utils.formatdate(cache_file.stat().st_mtime, usegmt=True)
+        }
+
+    @staticmethod
+    def _apply_last_modified(cache_file: Path, last_modified: Optional[str]):
+        """
+        Set a tile's mtime from the server's Last-Modified header.
+
+        Keeps later If-Modified-Since checks relative to the server's clock
+        rather than the time of download.
+
+        Args:
+            cache_file: Path to the cached tile file
+            last_modified: Last-Modified header value, if any
+        """
+        if not last_modified:
+            return
+
+        try:
+            timestamp = email.utils.parsedate_to_datetime(last_modified).timestamp()
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring unparseable Last-Modified header: {last_modified}")
+            return
+
+        os.utime(cache_file, (timestamp, timestamp))
+
     def _read_tile(self, tile_file: Path, bbox: Tuple[float, float, float, float]) -> np.ndarray:
         """
         Read elevation data from a single tile, clipped to bounding box.
@@ -362,10 +676,7 @@ class SRTMFetcher:
         Returns:
             numpy.ndarray: Elevation data
         """
-        dataset = gdal.Open(str(tile_file))
-
-        if dataset is None:
-            raise ValueError(f"Failed to open tile: {tile_file}")
+        dataset = self._open_dataset(tile_file)
 
         # Get geotransform
         geotransform = dataset.GetGeoTransform()
@@ -390,12 +701,47 @@ class SRTMFetcher:
 
         # Handle no-data values
         no_data = band.GetNoDataValue()
-        if no_data is not None:
-            elevation = np.where(elevation == no_data, np.nan, elevation)
 
-        dataset = None  # Close dataset
+        return _nodata_to_nan(elevation, no_data)
 
-        return elevation.astype(np.float32)
+    def _open_dataset(self, tile_file: Path):
+        """
+        Open a tile dataset, reusing a cached handle if available.
+
+        Keeps up to DATASET_CACHE_SIZE datasets open so repeated queries
+        over the same tiles skip re-parsing the TIFF headers.
+
+        Args:
+            tile_file: Path to the tile TIFF file
+
+        Returns:
+            gdal.Dataset: Open dataset
+
+        Raises:
+            ValueError: If the tile cannot be opened
+        """
+        key = str(Path(tile_file).resolve())
+
+        dataset = self._ds_cache.get(key)
+        if dataset is not None:
+            self._ds_cache.move_to_end(key)
+            return dataset
+
+        dataset = gdal.Open(key)
+
+        if dataset is None:
+            raise ValueError(f"Failed to open tile: {tile_file}")
+
+        self._ds_cache[key] = dataset
+        if len(self._ds_cache) > self.DATASET_CACHE_SIZE:
+            self._ds_cache.popitem(last=False)
+
+        return dataset
+
+    def close_cache(self):
+        """Close all cached tile datasets."""
+        # Dropping the last reference closes the GDAL dataset
+        self._ds_cache.clear()
 
     def _merge_tiles(self, tile_files: list, bbox: Tuple[float, float, float, float]) -> np.ndarray:
         """
@@ -426,25 +772,82 @@ class SRTMFetcher:
         if vrt is None:
             raise ValueError("Failed to merge tiles")
 
+        # Large mosaics are warped to disk and mapped rather than read onto the heap
+        if vrt.RasterXSize * vrt.RasterYSize > self.MEMMAP_THRESHOLD_PIXELS:
+            elevation = self._warp_to_memmap(vrt)
+            vrt = None  # Close
+            return elevation
+
         # Read merged data
         band = vrt.GetRasterBand(1)
         elevation = band.ReadAsArray()
 
         # Handle no-data
         no_data = band.GetNoDataValue()
-        if no_data is not None:
-            elevation = np.where(elevation == no_data, np.nan, elevation)
 
         vrt = None  # Close
 
-        return elevation.astype(np.float32)
+        return _nodata_to_nan(elevation, no_data)
+
+    def _warp_to_memmap(self, dataset) -> np.ndarray:
+        """
+        Write a dataset to a raw float32 file and memory-map it.
+
+        No-data values are converted to NaN during the warp, so the mapped
+        array is ready to use. The mapping is copy-on-write: callers may
+        modify it without touching the file.
+
+        Args:
+            dataset: GDAL dataset (e.g. the merged VRT)
+
+        Returns:
+            numpy.memmap: Elevation data backed by a file in the cache directory
+        """
+        no_data = dataset.GetRasterBand(1).GetNoDataValue()
+
+        fd, raw_path = tempfile.mkstemp(prefix="merged_", suffix=".bin", dir=self.cache_dir)
+        os.close(fd)
+
+        # ENVI is a headerless raw raster with a sidecar .hdr
+        warp_options = gdal.WarpOptions(
+            format='ENVI',
+            outputType=gdal.GDT_Float32,
+            srcNodata=no_data,
+            dstNodata=np.nan if no_data is not None else None
+        )
+
+        warped = gdal.Warp(raw_path, dataset, options=warp_options)
+
+        if warped is None:
+            raise ValueError("Failed to write merged tiles")
+
+        shape = (warped.RasterYSize, warped.RasterXSize)
+        warped = None  # Flush and close
+
+        for sidecar in (os.path.splitext(raw_path)[0] + ".hdr", raw_path + ".hdr", raw_path + ".aux.xml"):
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+
+        elevation = np.memmap(raw_path, dtype=np.float32, mode='c', shape=shape)
+
+        # The mapping stays valid after unlinking on POSIX; on Windows the
+        # file is left for clear_cache()
+        try:
+            os.remove(raw_path)
+        except OSError:
+            pass
+
+        return elevation
 
     def clear_cache(self):
         """Clear all cached SRTM tiles."""
+        self.close_cache()
         for file in self.cache_dir.glob("*.tif"):
             file.unlink()
         for file in self.cache_dir.glob("*.vrt"):
             file.unlink()
+        for file in self.cache_dir.glob("merged_*.bin"):
+            file.unlink()
 
     def get_cache_size(self) -> int:
         """
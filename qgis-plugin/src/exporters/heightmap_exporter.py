@@ -211,8 +211,8 @@ class HeightmapExporter:
         """
         processed = elevation.copy()
 
-        # Fill no-data
-        if fill_nodata:
+        # Fill no-data (only NaN-bearing arrays need interpolation)
+        if fill_nodata and np.isnan(processed).any():
             processed = self.processor.fill_nodata(processed, method='linear')
 
         # Resample
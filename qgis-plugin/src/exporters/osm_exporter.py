@@ -8,9 +8,219 @@ Supports JSON and CSV formats.
 import json
 import csv
 import os
-from typing import Dict, List, Tuple, Optional
+import zlib
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+
+# JSON output: bytes collected before each raw write
+_JSON_FLUSH_SIZE = 8 << 20
+
+# gzip level for compressed JSON (1 favours throughput over ratio)
+_GZIP_LEVEL = 1
+
+# Raw output file flags (O_BINARY keeps Windows from translating newlines)
+_RAW_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# CSV output: file buffer size and default rows formatted per write
+_CSV_BUFFER_SIZE = 1 << 20
+_CSV_CHUNK_ROWS = 100_000
+
+# CSV format shared by the header writer and the _csv_text row fast path
+csv.register_dialect(
+    'ue5fast',
+    delimiter=',',
+    quotechar='"',
+    quoting=csv.QUOTE_MINIMAL,
+    doublequote=True,
+    lineterminator='\r\n'
+)
+
+# Shared stand-in for missing tags; never mutated
+_EMPTY = {}
+
+# OSM object categories in export order
+_CATEGORIES = ('roads', 'buildings', 'pois', 'other')
+
+
+def _categories(ue5_data: Dict) -> Dict:
+    """Look up every category once; missing ones become an empty tuple."""
+    get = ue5_data.get
+    categories = {}
+    for key in _CATEGORIES:
+        items = get(key)
+        categories[key] = () if items is None else items
+    return categories
+
+
+def _is_frame(items) -> bool:
+    """Return True if a category is given as a pandas DataFrame (SoA)."""
+    return PANDAS_AVAILABLE and isinstance(items, pd.DataFrame)
+
+
+def _records(items) -> List[Dict]:
+    """
+    Return a category as a list of dicts.
+
+    Lists pass through unchanged. DataFrames are converted in one call,
+    with 'x'/'y'/'z' columns folded back into a 'position' tuple.
+    """
+    if not _is_frame(items):
+        return items
+
+    records = items.to_dict(orient='records')
+
+    if {'x', 'y', 'z'} <= set(items.columns):
+        for record in records:
+            record['position'] = (record.pop('x'), record.pop('y'), record.pop('z'))
+
+    return records
+
+
+def _prefixed_ids(prefix: str, osm_ids) -> np.ndarray:
+    """Build an ID column such as 'way_123' from OSM IDs in one vectorized pass."""
+    return np.char.add(prefix, np.asarray(osm_ids).astype(np.int64).astype(str))
+
+
+def _csv_text(value) -> str:
+    """Format a text field for CSV, quoting it the way the 'ue5fast' dialect would."""
+    if value is None:
+        return ''
+    value = str(value)
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _points_to_list(points) -> List[List[float]]:
+    """Convert (x, y, z) points to nested [x, y, z] lists for JSON."""
+    # An (N, 3) array converts in a single C call. A JIT kernel cannot beat
+    # tolist() here since its typed list would still need converting back
+    # to Python objects. Coercing lists of tuples through NumPy first is
+    # slower than the comprehension.
+    if isinstance(points, np.ndarray) and points.ndim == 2:
+        return points[:, :3].tolist()
+
+    return [[p[0], p[1], p[2]] for p in points]
+
+
+def _write_batched(f, rows: Iterable[str], chunk_size: int = _CSV_CHUNK_ROWS):
+    """
+    Write pre-formatted rows in joined chunks of chunk_size rows.
+
+    Only one chunk is held in memory at a time, so peak memory is bounded
+    by chunk_size rather than by the number of rows.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = ''.join(islice(rows, chunk_size))
+        if not chunk:
+            break
+        f.write(chunk)
+
+
+def _write_all(fd: int, data) -> None:
+    """Write a bytes-like object to a raw file descriptor, handling short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_chunks(output_path: str, chunks: Iterable[bytes]) -> None:
+    """
+    Write byte chunks to a file through a raw descriptor.
+
+    Chunks are gathered into one buffer and written in blocks of about
+    _JSON_FLUSH_SIZE bytes, so there is no second copy through a Python
+    file buffer. They go to a temporary file next to output_path that
+    replaces it only once every chunk is written, so an error while the
+    chunks are produced leaves any existing file untouched.
+    """
+    tmp_path = output_path + '.tmp'
+    fd = os.open(tmp_path, _RAW_WRITE_FLAGS, 0o644)
+    try:
+        try:
+            buf = bytearray()
+            for chunk in chunks:
+                buf += chunk
+                if len(buf) >= _JSON_FLUSH_SIZE:
+                    _write_all(fd, buf)
+                    buf.clear()
+
+            if buf:
+                _write_all(fd, buf)
+        finally:
+            os.close(fd)
+
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _share_tags(features: Iterable[Dict], index: Dict, pool: List[Dict]) -> Iterator[Dict]:
+    """
+    Replace each feature's 'tags' with a 'tag_ref' index into a shared pool.
+
+    Identical tag sets are stored once in pool; index maps a tag set's
+    items to its position there. Both are filled in as features stream by.
+    """
+    for feature in features:
+        tags = feature.pop('tags', None)
+        if tags:
+            key = frozenset(tags.items())
+            ref = index.get(key)
+            if ref is None:
+                ref = index[key] = len(pool)
+                pool.append(tags)
+            feature['tag_ref'] = ref
+        yield feature
+
+
+def _gzip_chunks(chunks: Iterable[bytes], level: int = _GZIP_LEVEL) -> Iterator[bytes]:
+    """Compress a stream of byte chunks into gzip format on the fly."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _dumps(obj) -> bytes:
+    """Serialize one object as compact UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize one object as a compact, newline-terminated UTF-8 JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
 
 class OSMExporter:
     """
@@ -33,7 +243,9 @@ class OSMExporter:
         ue5_data: Dict,
         output_path: str,
         bbox: Tuple[float, float, float, float],
-        terrain_origin: Tuple[float, float, float] = (0, 0, 0)
+        terrain_origin: Tuple[float, float, float] = (0, 0, 0),
+        share_tags: bool = False,
+        compress: bool = False
     ) -> str:
         """
         Export OSM objects as JSON.
@@ -43,6 +255,11 @@ class OSMExporter:
             output_path: Output JSON file path
             bbox: Bounding box
             terrain_origin: UE5 terrain origin
+            share_tags: Store each distinct tag set once in a top-level
+                'tag_pool' list and give features a 'tag_ref' index
+                instead of their own 'tags'. Shrinks exports where many
+                features share tags (e.g. {'building': 'yes'}).
+            compress: Write gzip-compressed JSON to output_path + '.gz'
 
         Returns:
             str: Path to created JSON file
@@ -55,134 +272,256 @@ class OSMExporter:
             ...     bbox
             ... )
         """
-        # Build export structure
-        export_data = {
-            'metadata': {
-                'bbox': {
-                    'min_lon': bbox[0],
-                    'min_lat': bbox[1],
-                    'max_lon': bbox[2],
-                    'max_lat': bbox[3]
-                },
-                'terrain_origin': {
-                    'x': terrain_origin[0],
-                    'y': terrain_origin[1],
-                    'z': terrain_origin[2]
-                },
-                'counts': {
-                    'buildings': len(ue5_data.get('buildings', [])),
-                    'roads': len(ue5_data.get('roads', [])),
-                    'pois': len(ue5_data.get('pois', [])),
-                    'other': len(ue5_data.get('other', []))
-                }
-            },
-            'roads': self._format_roads_json(ue5_data.get('roads', [])),
-            'buildings': self._format_buildings_json(ue5_data.get('buildings', [])),
-            'pois': self._format_pois_json(ue5_data.get('pois', [])),
-            'other': self._format_other_json(ue5_data.get('other', []))
-        }
+        # Stream the object one feature at a time so the formatted
+        # feature lists never have to exist in memory all at once
+        chunks = self._iter_json_chunks(ue5_data, bbox, terrain_origin, share_tags)
 
-        # Write JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if compress:
+            output_path += '.gz'
+            chunks = _gzip_chunks(chunks)
+
+        _write_chunks(output_path, chunks)
+
+        return output_path
+
+    def _iter_json_chunks(
+        self,
+        ue5_data: Dict,
+        bbox: Tuple[float, float, float, float],
+        terrain_origin: Tuple[float, float, float],
+        share_tags: bool = False
+    ) -> Iterator[bytes]:
+        """Yield the encoded JSON document piece by piece."""
+        categories = _categories(ue5_data)
+
+        yield b'{\n  "metadata": '
+        yield _dumps(self._build_metadata(categories, bbox, terrain_origin))
+
+        tag_index = {}
+        tag_pool = []
+
+        for category, features in self._iter_categories_json(categories):
+            if share_tags:
+                features = _share_tags(features, tag_index, tag_pool)
+
+            yield from self._iter_json_array(category, features)
+
+        # The pool is complete only once every feature has been written
+        if share_tags:
+            yield from self._iter_json_array('tag_pool', tag_pool)
+
+        yield b'\n}\n'
+
+    def _iter_json_array(self, key: str, items: Iterable[Dict]) -> Iterator[bytes]:
+        """Yield one top-level '"key": [...]' member, one item per line."""
+        yield b',\n  "' + key.encode('ascii') + b'": ['
+
+        sep = b'\n    '
+        for item in items:
+            yield sep
+            yield _dumps(item)
+            sep = b',\n    '
+
+        yield b']' if sep == b'\n    ' else b'\n  ]'
+
+    def export_jsonseq(
+        self,
+        ue5_data: Dict,
+        output_path: str,
+        bbox: Tuple[float, float, float, float],
+        terrain_origin: Tuple[float, float, float] = (0, 0, 0)
+    ) -> str:
+        """
+        Export OSM objects as a line-delimited JSON feature stream.
+
+        The first line holds the metadata; every following line is one
+        self-contained feature tagged with its 'category' (roads, buildings,
+        pois, other). Importers can parse features one line at a time
+        instead of loading the whole file.
+
+        Args:
+            ue5_data: Converted UE5 data (from OSMToUE5Converter)
+            output_path: Output file path (e.g. 'osm_objects.jsonl')
+            bbox: Bounding box
+            terrain_origin: UE5 terrain origin
+
+        Returns:
+            str: Path to created file
+
+        Example:
+            >>> exporter = OSMExporter()
+            >>> exporter.export_jsonseq(ue5_data, 'osm_objects.jsonl', bbox)
+        """
+        _write_chunks(
+            output_path,
+            self._iter_jsonseq_chunks(ue5_data, bbox, terrain_origin)
+        )
 
         return output_path
 
-    def _format_roads_json(self, roads: List[Dict]) -> List[Dict]:
-        """Format roads for JSON export."""
-        formatted = []
+    def _iter_jsonseq_chunks(
+        self,
+        ue5_data: Dict,
+        bbox: Tuple[float, float, float, float],
+        terrain_origin: Tuple[float, float, float]
+    ) -> Iterator[bytes]:
+        """Yield the encoded JSON lines: metadata first, then one per feature."""
+        categories = _categories(ue5_data)
+
+        yield _dumps_line(self._build_metadata(categories, bbox, terrain_origin))
+
+        for category, features in self._iter_categories_json(categories):
+            for feature in features:
+                feature['category'] = category
+                yield _dumps_line(feature)
+
+    def _iter_categories_json(self, categories: Dict) -> Iterator[Tuple[str, Iterator[Dict]]]:
+        """Yield (category, formatted feature iterator) pairs in export order."""
+        yield 'roads', self._iter_roads_json(_records(categories['roads']))
+        yield 'buildings', self._iter_buildings_json(_records(categories['buildings']))
+        yield 'pois', self._iter_pois_json(_records(categories['pois']))
+        yield 'other', self._iter_other_json(_records(categories['other']))
+
+    def _build_metadata(
+        self,
+        categories: Dict,
+        bbox: Tuple[float, float, float, float],
+        terrain_origin: Tuple[float, float, float]
+    ) -> Dict:
+        """Build the metadata block shared by the JSON exports."""
+        return {
+            'bbox': {
+                'min_lon': bbox[0],
+                'min_lat': bbox[1],
+                'max_lon': bbox[2],
+                'max_lat': bbox[3]
+            },
+            'terrain_origin': {
+                'x': terrain_origin[0],
+                'y': terrain_origin[1],
+                'z': terrain_origin[2]
+            },
+            'counts': {
+                'buildings': len(categories['buildings']),
+                'roads': len(categories['roads']),
+                'pois': len(categories['pois']),
+                'other': len(categories['other'])
+            }
+        }
+
+    def _iter_roads_json(self, roads: List[Dict]) -> Iterator[Dict]:
+        """Yield roads formatted for JSON export."""
+        way = "way_{}".format
 
         for road in roads:
+            get = road.get
+
             # Convert spline points to simple [x, y, z] arrays
-            points = [
-                [p[0], p[1], p[2]]
-                for p in road.get('spline_points', [])
-            ]
+            points = _points_to_list(get('spline_points', []))
 
-            formatted.append({
-                'id': f"way_{road.get('osm_id', 0)}",
-                'type': road.get('highway_type', 'unknown'),
-                'name': road.get('name', ''),
+            entry = {
+                'id': way(get('osm_id', 0)),
+                'type': get('highway_type', 'unknown'),
+                'name': get('name', ''),
                 'points': points,
-                'width': road.get('width', 500),  # cm
-                'lanes': road.get('lanes', 2),
-                'tags': road.get('tags', {})
-            })
+                'width': get('width', 500),  # cm
+                'lanes': get('lanes', 2)
+            }
+
+            # Empty tags are omitted to keep the output small
+            tags = get('tags')
+            if tags:
+                entry['tags'] = tags
 
-        return formatted
+            yield entry
 
-    def _format_buildings_json(self, buildings: List[Dict]) -> List[Dict]:
-        """Format buildings for JSON export."""
-        formatted = []
+    def _iter_buildings_json(self, buildings: List[Dict]) -> Iterator[Dict]:
+        """Yield buildings formatted for JSON export."""
+        way = "way_{}".format
 
         for building in buildings:
+            get = building.get
+
             # Convert footprint to simple [x, y, z] arrays
-            footprint = [
-                [p[0], p[1], p[2]]
-                for p in building.get('footprint', [])
-            ]
+            footprint = _points_to_list(get('footprint', []))
 
             # Position
-            pos = building.get('position', (0, 0, 0))
+            pos = get('position', (0, 0, 0))
 
-            formatted.append({
-                'id': f"way_{building.get('osm_id', 0)}",
-                'type': building.get('building_type', 'yes'),
+            entry = {
+                'id': way(get('osm_id', 0)),
+                'type': get('building_type', 'yes'),
                 'position': [pos[0], pos[1], pos[2]],
-                'rotation': building.get('rotation', 0.0),
+                'rotation': get('rotation', 0.0),
                 'footprint': footprint,
-                'height': building.get('height', 300),  # cm
-                'levels': building.get('levels', 1),
-                'tags': building.get('tags', {})
-            })
+                'height': get('height', 300),  # cm
+                'levels': get('levels', 1)
+            }
 
-        return formatted
+            tags = get('tags')
+            if tags:
+                entry['tags'] = tags
 
-    def _format_pois_json(self, pois: List[Dict]) -> List[Dict]:
-        """Format POIs for JSON export."""
-        formatted = []
+            yield entry
+
+    def _iter_pois_json(self, pois: List[Dict]) -> Iterator[Dict]:
+        """Yield POIs formatted for JSON export."""
+        node = "node_{}".format
 
         for poi in pois:
+            get = poi.get
+
             # Position
-            pos = poi.get('position', (0, 0, 0))
+            pos = get('position', (0, 0, 0))
 
-            formatted.append({
-                'id': f"node_{poi.get('osm_id', 0)}",
-                'type': poi.get('amenity', 'unknown'),
-                'name': poi.get('name', ''),
-                'position': [pos[0], pos[1], pos[2]],
-                'tags': poi.get('tags', {})
-            })
+            entry = {
+                'id': node(get('osm_id', 0)),
+                'type': get('amenity', 'unknown'),
+                'name': get('name', ''),
+                'position': [pos[0], pos[1], pos[2]]
+            }
+
+            tags = get('tags')
+            if tags:
+                entry['tags'] = tags
 
-        return formatted
+            yield entry
 
-    def _format_other_json(self, others: List[Dict]) -> List[Dict]:
-        """Format other OSM features for JSON export."""
-        formatted = []
+    def _iter_other_json(self, others: List[Dict]) -> Iterator[Dict]:
+        """Yield other OSM features formatted for JSON export."""
+        way = "way_{}".format
 
         for other in others:
-            tags = other.get('tags', {})
+            get = other.get
+
+            entry = {'id': way(get('id', 0))}
 
-            formatted.append({
-                'id': f"way_{other.get('id', 0)}",
-                'tags': tags
-            })
+            tags = get('tags')
+            if tags:
+                entry['tags'] = tags
 
-        return formatted
+            yield entry
 
     def export_csv(
         self,
         ue5_data: Dict,
         output_dir: str,
-        bbox: Tuple[float, float, float, float]
+        bbox: Tuple[float, float, float, float],
+        chunk_size: int = _CSV_CHUNK_ROWS
     ) -> Dict[str, str]:
         """
         Export OSM objects as CSV files (one per category).
 
+        Categories may be lists of dicts or pandas DataFrames (one column
+        per field, position split into 'x', 'y', 'z'; building and POI
+        names in 'name'; roads carry 'spline_points'). DataFrames are
+        written with pandas' C CSV writer.
+
         Args:
             ue5_data: Converted UE5 data
             output_dir: Output directory
             bbox: Bounding box
+            chunk_size: Rows formatted and written per batch
 
         Returns:
             dict: Paths to created CSV files
@@ -194,32 +533,71 @@ class OSMExporter:
         """
         os.makedirs(output_dir, exist_ok=True)
 
-        created_files = {}
-
-        # Export buildings
-        if ue5_data.get('buildings'):
-            buildings_path = os.path.join(output_dir, 'buildings.csv')
-            self._export_buildings_csv(ue5_data['buildings'], buildings_path)
-            created_files['buildings'] = buildings_path
+        return self._write_csv_files(ue5_data, output_dir, chunk_size)
 
-        # Export roads
-        if ue5_data.get('roads'):
-            roads_path = os.path.join(output_dir, 'roads.csv')
-            self._export_roads_csv(ue5_data['roads'], roads_path)
-            created_files['roads'] = roads_path
+    def _write_csv_files(
+        self,
+        ue5_data: Dict,
+        output_dir: str,
+        chunk_size: int = _CSV_CHUNK_ROWS
+    ) -> Dict[str, str]:
+        """Write the category CSV files into an existing output directory."""
+        created_files = {}
+        categories = _categories(ue5_data)
+        join = os.path.join
+
+        # One task per non-empty category (buildings, roads, POIs)
+        tasks = [
+            (key, export, join(output_dir, f'{key}.csv'))
+            for key, export in (
+                ('buildings', self._export_buildings_csv),
+                ('roads', self._export_roads_csv),
+                ('pois', self._export_pois_csv)
+            )
+            if len(categories[key]) > 0
+        ]
+
+        if not tasks:
+            return created_files
+
+        # Categories write to independent files, so overlap their I/O
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = [
+                pool.submit(export, categories[key], path, chunk_size)
+                for key, export, path in tasks
+            ]
 
-        # Export POIs
-        if ue5_data.get('pois'):
-            pois_path = os.path.join(output_dir, 'pois.csv')
-            self._export_pois_csv(ue5_data['pois'], pois_path)
-            created_files['pois'] = pois_path
+        for (key, _, path), future in zip(tasks, futures):
+            future.result()  # Re-raise any write error
+            created_files[key] = path
 
         return created_files
 
-    def _export_buildings_csv(self, buildings: List[Dict], output_path: str):
+    def _export_buildings_csv(
+        self,
+        buildings: List[Dict],
+        output_path: str,
+        chunk_size: int = _CSV_CHUNK_ROWS
+    ):
         """Export buildings to CSV."""
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
+        if _is_frame(buildings):
+            pd.DataFrame({
+                'ID': _prefixed_ids('way_', buildings['osm_id']),
+                'Type': buildings['building_type'],
+                'X (cm)': buildings['x'],
+                'Y (cm)': buildings['y'],
+                'Z (cm)': buildings['z'],
+                'Rotation (deg)': buildings['rotation'],
+                'Height (cm)': buildings['height'],
+                'Levels': buildings['levels'],
+                'Name': buildings['name']
+            }).to_csv(
+                output_path, index=False, lineterminator='\r\n', chunksize=chunk_size
+            )
+            return
+
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f, dialect='ue5fast')
 
             # Header
             writer.writerow([
@@ -228,26 +606,54 @@ class OSMExporter:
             ])
 
             # Data
-            for building in buildings:
-                pos = building.get('position', (0, 0, 0))
-                tags = building.get('tags', {})
-
-                writer.writerow([
-                    f"way_{building.get('osm_id', 0)}",
-                    building.get('building_type', 'yes'),
-                    pos[0],
-                    pos[1],
-                    pos[2],
-                    building.get('rotation', 0.0),
-                    building.get('height', 300),
-                    building.get('levels', 1),
-                    tags.get('name', '')
-                ])
-
-    def _export_roads_csv(self, roads: List[Dict], output_path: str):
+            _write_batched(f, self._iter_buildings_csv_rows(buildings), chunk_size)
+
+    def _iter_buildings_csv_rows(self, buildings: List[Dict]) -> Iterator[str]:
+        """Yield formatted building CSV rows."""
+        way = "way_{}".format
+
+        # Numeric fields need no quoting, so skip the csv state machine
+        fmt = '{},{},{},{},{},{},{},{},{}\r\n'.format
+
+        for building in buildings:
+            get = building.get
+            pos = get('position', (0, 0, 0))
+            tags = get('tags') or _EMPTY
+
+            yield fmt(
+                way(get('osm_id', 0)),
+                _csv_text(get('building_type', 'yes')),
+                pos[0],
+                pos[1],
+                pos[2],
+                get('rotation', 0.0),
+                get('height', 300),
+                get('levels', 1),
+                _csv_text(tags.get('name', ''))
+            )
+
+    def _export_roads_csv(
+        self,
+        roads: List[Dict],
+        output_path: str,
+        chunk_size: int = _CSV_CHUNK_ROWS
+    ):
         """Export roads to CSV."""
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
+        if _is_frame(roads):
+            pd.DataFrame({
+                'ID': _prefixed_ids('way_', roads['osm_id']),
+                'Type': roads['highway_type'],
+                'Name': roads['name'],
+                'Width (cm)': roads['width'],
+                'Lanes': roads['lanes'],
+                'Points Count': roads['spline_points'].map(len)
+            }).to_csv(
+                output_path, index=False, lineterminator='\r\n', chunksize=chunk_size
+            )
+            return
+
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f, dialect='ue5fast')
 
             # Header
             writer.writerow([
@@ -255,20 +661,47 @@ class OSMExporter:
             ])
 
             # Data
-            for road in roads:
-                writer.writerow([
-                    f"way_{road.get('osm_id', 0)}",
-                    road.get('highway_type', 'unknown'),
-                    road.get('name', ''),
-                    road.get('width', 500),
-                    road.get('lanes', 2),
-                    len(road.get('spline_points', []))
-                ])
-
-    def _export_pois_csv(self, pois: List[Dict], output_path: str):
+            _write_batched(f, self._iter_roads_csv_rows(roads), chunk_size)
+
+    def _iter_roads_csv_rows(self, roads: List[Dict]) -> Iterator[str]:
+        """Yield formatted road CSV rows."""
+        way = "way_{}".format
+        fmt = '{},{},{},{},{},{}\r\n'.format
+
+        for road in roads:
+            get = road.get
+
+            yield fmt(
+                way(get('osm_id', 0)),
+                _csv_text(get('highway_type', 'unknown')),
+                _csv_text(get('name', '')),
+                get('width', 500),
+                get('lanes', 2),
+                len(get('spline_points', []))
+            )
+
+    def _export_pois_csv(
+        self,
+        pois: List[Dict],
+        output_path: str,
+        chunk_size: int = _CSV_CHUNK_ROWS
+    ):
         """Export POIs to CSV."""
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
+        if _is_frame(pois):
+            pd.DataFrame({
+                'ID': _prefixed_ids('node_', pois['osm_id']),
+                'Type': pois['amenity'],
+                'Name': pois['name'],
+                'X (cm)': pois['x'],
+                'Y (cm)': pois['y'],
+                'Z (cm)': pois['z']
+            }).to_csv(
+                output_path, index=False, lineterminator='\r\n', chunksize=chunk_size
+            )
+            return
+
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f, dialect='ue5fast')
 
             # Header
             writer.writerow([
@@ -276,17 +709,25 @@ class OSMExporter:
             ])
 
             # Data
-            for poi in pois:
-                pos = poi.get('position', (0, 0, 0))
-
-                writer.writerow([
-                    f"node_{poi.get('osm_id', 0)}",
-                    poi.get('amenity', 'unknown'),
-                    poi.get('name', ''),
-                    pos[0],
-                    pos[1],
-                    pos[2]
-                ])
+            _write_batched(f, self._iter_pois_csv_rows(pois), chunk_size)
+
+    def _iter_pois_csv_rows(self, pois: List[Dict]) -> Iterator[str]:
+        """Yield formatted POI CSV rows."""
+        node = "node_{}".format
+        fmt = '{},{},{},{},{},{}\r\n'.format
+
+        for poi in pois:
+            get = poi.get
+            pos = get('position', (0, 0, 0))
+
+            yield fmt(
+                node(get('osm_id', 0)),
+                _csv_text(get('amenity', 'unknown')),
+                _csv_text(get('name', '')),
+                pos[0],
+                pos[1],
+                pos[2]
+            )
 
     def export_complete(
         self,
@@ -332,7 +773,8 @@ class OSMExporter:
 
         # Export CSV
         if format in ['csv', 'both']:
-            csv_files = self.export_csv(ue5_data, output_dir, bbox)
+            # output_dir was created above
+            csv_files = self._write_csv_files(ue5_data, output_dir)
             for key, path in csv_files.items():
                 created_files[f'{key}_csv'] = path
 
@@ -353,25 +795,15 @@ class OSMExporter:
         Returns:
             str: Path to created summary file
         """
-        buildings = ue5_data.get('buildings', [])
-        roads = ue5_data.get('roads', [])
-        pois = ue5_data.get('pois', [])
+        categories = _categories(ue5_data)
+        buildings = _records(categories['buildings'])
+        roads = _records(categories['roads'])
+        pois = _records(categories['pois'])
 
         # Count by type
-        building_types = {}
-        for building in buildings:
-            btype = building.get('building_type', 'yes')
-            building_types[btype] = building_types.get(btype, 0) + 1
-
-        road_types = {}
-        for road in roads:
-            rtype = road.get('highway_type', 'unknown')
-            road_types[rtype] = road_types.get(rtype, 0) + 1
-
-        poi_types = {}
-        for poi in pois:
-            ptype = poi.get('amenity', 'unknown')
-            poi_types[ptype] = poi_types.get(ptype, 0) + 1
+        building_types = Counter(b.get('building_type', 'yes') for b in buildings)
+        road_types = Counter(r.get('highway_type', 'unknown') for r in roads)
+        poi_types = Counter(p.get('amenity', 'unknown') for p in pois)
 
         # Write summary
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -381,17 +813,17 @@ class OSMExporter:
             f.write(f"Total Objects: {len(buildings) + len(roads) + len(pois)}\n\n")
 
             f.write(f"Buildings: {len(buildings)}\n")
-            for btype, count in sorted(building_types.items(), key=lambda x: -x[1]):
+            for btype, count in building_types.most_common():
                 f.write(f"  {btype}: {count}\n")
             f.write("\n")
 
             f.write(f"Roads: {len(roads)}\n")
-            for rtype, count in sorted(road_types.items(), key=lambda x: -x[1]):
+            for rtype, count in road_types.most_common():
                 f.write(f"  {rtype}: {count}\n")
             f.write("\n")
 
             f.write(f"POIs: {len(pois)}\n")
-            for ptype, count in sorted(poi_types.items(), key=lambda x: -x[1]):
+            for ptype, count in poi_types.most_common():
                 f.write(f"  {ptype}: {count}\n")
 
         return output_path
@@ -411,7 +843,7 @@ def export_osm_objects(
         ue5_data: Converted UE5 data
         output_path: Output file path (or directory for CSV)
         bbox: Bounding box
-        format: 'json' or 'csv'
+        format: 'json', 'jsonseq' or 'csv'
         terrain_origin: UE5 terrain origin
 
     Returns:
@@ -430,6 +862,8 @@ def export_osm_objects(
 
     if format == 'json':
         return exporter.export_json(ue5_data, output_path, bbox, terrain_origin)
+    elif format == 'jsonseq':
+        return exporter.export_jsonseq(ue5_data, output_path, bbox, terrain_origin)
     elif format == 'csv':
         output_dir = output_path if os.path.isdir(output_path) else os.path.dirname(output_path)
         exporter.export_csv(ue5_data, output_dir, bbox)
@@ -13,11 +13,336 @@ import json
 import zlib
 import hashlib
 import os
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, BinaryIO
+from typing import Dict, Any, List, Optional, BinaryIO, Tuple
 import numpy as np
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import deflate
+    LIBDEFLATE_AVAILABLE = True
+except ImportError:
+    LIBDEFLATE_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Compression levels. Past 6, zlib costs several times the CPU for a few
+# percent; satellite JPEG is already compressed, so it gets the fastest level.
+ZSTD_LEVEL = 6
+ZLIB_LEVEL = 6
+PRECOMPRESSED_LEVEL = 1
+
+# Input slice size for the streaming compressors
+COMPRESS_CHUNK_SIZE = 1 << 20
+
+# Output file buffer; coalesces the many small header/size writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Suggested heightmap_scale for create_package, in meters. Quantizing is
+# lossy (up to half a step of error), so it is opt-in; 1 cm stays finer than
+# a 16-bit UE5 landscape, which steps about 4.6 cm over 3 km of relief.
+HEIGHTMAP_SCALE = 0.01
+
+
+def _dumps(obj) -> bytes:
+    """Serialize one object as compact UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data) -> Any:
+    """Parse UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _new_block_hasher(algo: str):
+    """Create a hasher for a block checksum algorithm ('xxh3_128' or 'md5')."""
+    if algo == 'xxh3_128':
+        if not XXHASH_AVAILABLE:
+            raise ValueError("Block uses an xxh3_128 checksum but xxhash is not installed")
+        return xxhash.xxh3_128()
+    if algo == 'md5':
+        return hashlib.md5()
+    raise ValueError(f"Unsupported block checksum: {algo}")
+
+
+def _compress(data_bytes, codec: str, level: int) -> List[bytes]:
+    """
+    Compress a block payload with the given codec.
+
+    zstd and stdlib zlib are fed COMPRESS_CHUNK_SIZE slices and return the
+    compressed output as a list of pieces, so neither the input nor the
+    output is ever duplicated in full. libdeflate has no streaming API and
+    returns a single piece.
+
+    'zlib' output is a standard zlib stream either way; libdeflate is only
+    a faster encoder for it, so any zlib reader can decompress the block.
+    """
+    view = memoryview(data_bytes)
+
+    if codec == 'zstd':
+        compressor = zstandard.ZstdCompressor(level=level, threads=-1).compressobj(
+            size=len(view)
+        )
+    elif LIBDEFLATE_AVAILABLE:
+        return [deflate.zlib_compress(view, level)]
+    else:
+        compressor = zlib.compressobj(level)
+
+    pieces = []
+    for start in range(0, len(view), COMPRESS_CHUNK_SIZE):
+        piece = compressor.compress(view[start:start + COMPRESS_CHUNK_SIZE])
+        if piece:
+            pieces.append(piece)
+    pieces.append(compressor.flush())
+
+    return pieces
+
+
+def _decompress(compressed, codec: str, uncompressed_size: int) -> bytes:
+    """
+    Decompress a block payload written by _compress.
+
+    Raises:
+        ValueError: If the codec is unknown or its library is not installed
+    """
+    if codec == 'zlib':
+        if LIBDEFLATE_AVAILABLE:
+            return bytes(deflate.zlib_decompress(compressed, uncompressed_size))
+        return zlib.decompress(compressed)
+    if codec == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Block is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(
+            compressed,
+            max_output_size=uncompressed_size
+        )
+    raise ValueError(f"Unsupported block compression: {codec}")
+
+
+def _is_binary_mask(data: np.ndarray) -> bool:
+    """Return True for boolean or 0/1 uint8 arrays that can be bit-packed."""
+    if data.ndim == 0 or data.size == 0:
+        return False
+    if data.dtype == np.bool_:
+        return True
+    return data.dtype == np.uint8 and data.max() <= 1
+
+
+def _delta_encode_heights(data: np.ndarray, scale: float) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Quantize a float32 heightmap to steps of scale meters and delta-encode it.
+
+    Each row stores differences to its left neighbour; the first column
+    stores differences down the column, starting from an offset (the first
+    sample). Deltas cluster near zero, which compresses far better than
+    raw float32 bits, and fit int16 unless neighbouring samples differ by
+    more than 32767 steps (then int32 is used).
+
+    Args:
+        data: Heightmap in meters
+        scale: Quantization step in meters
+
+    Returns:
+        tuple: (integer deltas, offset), or None if the array can't be
+        encoded (not 2D, empty, or containing NaN/inf)
+    """
+    if data.ndim != 2 or data.size == 0 or not np.isfinite(data).all():
+        return None
+
+    quantized = np.rint(data / scale).astype(np.int32)
+    offset = int(quantized[0, 0])
+
+    deltas = np.empty_like(quantized)
+    deltas[:, 1:] = np.diff(quantized, axis=1)
+    deltas[1:, 0] = np.diff(quantized[:, 0])
+    deltas[0, 0] = 0
+
+    if deltas.min() >= -32768 and deltas.max() <= 32767:
+        deltas = deltas.astype(np.int16)
+
+    return deltas, offset
+
+
+def _prepare_block(block_name: str, data: Any, heightmap_scale: Optional[float] = None) -> Tuple[Dict, List[bytes]]:
+    """
+    Serialize and compress one data block without touching the file.
+
+    Args:
+        block_name: Block name (e.g. 'heightmap', 'material_grass')
+        data: Numpy array, raw bytes or JSON-serializable object
+        heightmap_scale: Quantization step in meters for a float32
+            heightmap (lossy); None stores it exactly
+
+    Returns:
+        tuple: (block header dict, compressed payload pieces)
+    """
+    encoding = None
+
+    # Prepare data for compression
+    if isinstance(data, np.ndarray):
+        data_type = 'numpy'
+        data_dtype = str(data.dtype)
+        data_shape = list(data.shape)
+
+        # Binary material masks are stored 1 bit per pixel
+        if block_name.startswith('material_') and _is_binary_mask(data):
+            data = np.packbits(data, axis=-1)
+            encoding = 'packbits'
+
+        # Float heightmaps are stored as quantized row deltas, if requested
+        elif block_name == 'heightmap' and heightmap_scale is not None and data.dtype == np.float32:
+            encoded = _delta_encode_heights(data, heightmap_scale)
+            if encoded is not None:
+                data, delta_offset = encoded
+                encoding = 'delta'
+
+        # Numpy array - compress its buffer in place (copies only if not
+        # C-contiguous) instead of duplicating it with tobytes()
+        data_bytes = memoryview(np.ascontiguousarray(data).reshape(-1).view(np.uint8))
+    elif isinstance(data, bytes):
+        # Already bytes (e.g., JPEG)
+        data_bytes = data
+        data_type = 'bytes'
+        data_dtype = None
+        data_shape = None
+    else:
+        # JSON-serializable (dict, list, etc.)
+        data_bytes = _dumps(data)
+        data_type = 'json'
+        data_dtype = None
+        data_shape = None
+
+    # Compress (zstd for large numeric arrays when available)
+    codec = 'zstd' if data_type == 'numpy' and ZSTD_AVAILABLE else 'zlib'
+    if block_name == 'satellite':
+        level = PRECOMPRESSED_LEVEL
+    elif codec == 'zstd':
+        level = ZSTD_LEVEL
+    else:
+        level = ZLIB_LEVEL
+
+    compressed = _compress(data_bytes, codec, level)
+
+    # xxh3 is several times faster than MD5 on large blocks
+    checksum_algo = 'xxh3_128' if XXHASH_AVAILABLE else 'md5'
+    hasher = _new_block_hasher(checksum_algo)
+    for piece in compressed:
+        hasher.update(piece)
+
+    block_header = {
+        'name': block_name,
+        'type': data_type,
+        'dtype': data_dtype,
+        'shape': data_shape,
+        'uncompressed_size': len(data_bytes),
+        'compressed_size': sum(len(piece) for piece in compressed),
+        'compression': codec,
+        'level': level,
+        'checksum': hasher.hexdigest(),
+        'checksum_algo': checksum_algo
+    }
+
+    if encoding is not None:
+        block_header['encoding'] = encoding
+
+    if encoding == 'delta':
+        block_header['delta_dtype'] = str(data.dtype)
+        block_header['scale'] = heightmap_scale
+        block_header['offset'] = delta_offset
+
+    return block_header, compressed
+
+
+def _decode_numpy(data_bytes: bytes, block_header: Dict) -> np.ndarray:
+    """Rebuild a numpy block from its decompressed bytes."""
+    dtype = block_header['dtype']
+    shape = block_header['shape']
+
+    if block_header.get('encoding') == 'packbits':
+        packed = np.frombuffer(data_bytes, dtype=np.uint8).reshape(
+            shape[:-1] + [(shape[-1] + 7) // 8]
+        )
+        return np.unpackbits(packed, axis=-1, count=shape[-1]).astype(dtype, copy=False)
+
+    if block_header.get('encoding') == 'delta':
+        deltas = np.frombuffer(data_bytes, dtype=block_header['delta_dtype']).reshape(shape)
+        quantized = deltas.astype(np.int64)
+        quantized[:, 0] = np.cumsum(quantized[:, 0]) + block_header['offset']
+        np.cumsum(quantized, axis=1, out=quantized)
+        return (quantized * block_header['scale']).astype(dtype)
+
+    return np.frombuffer(data_bytes, dtype=dtype).reshape(shape)
+
+
+def _decode_block(block_header: Dict, compressed: bytes) -> Any:
+    """Verify, decompress and convert one stored data block."""
+    # Verify checksum (files without an algorithm field use MD5)
+    hasher = _new_block_hasher(block_header.get('checksum_algo', 'md5'))
+    hasher.update(compressed)
+    if hasher.hexdigest() != block_header['checksum']:
+        raise ValueError(f"Checksum mismatch for block {block_header['name']}")
+
+    # Decompress (files without a codec field are zlib)
+    data_bytes = _decompress(
+        compressed,
+        block_header.get('compression', 'zlib'),
+        block_header['uncompressed_size']
+    )
+
+    # Convert back to original type
+    if block_header['type'] == 'numpy':
+        return _decode_numpy(data_bytes, block_header)
+    elif block_header['type'] == 'json':
+        return _loads(data_bytes)
+    else:  # bytes
+        return data_bytes
+
+
+class _HashingWriter:
+    """
+    File wrapper that feeds every written byte into a SHA-256 hasher.
+
+    Lets the package checksum be computed while writing instead of
+    re-reading the finished file.
+    """
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self._hasher = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self._hasher.update(data)
+        return self._f.write(data)
+
+    def tell(self) -> int:
+        return self._f.tell()
+
+    def digest(self) -> bytes:
+        return self._hasher.digest()
+
 
 class RTerrainFormat:
     """
@@ -28,18 +353,27 @@ class RTerrainFormat:
     - Version (4 bytes): uint32
     - Header size (4 bytes): uint32
     - Header (JSON metadata, variable size)
+    - Index size (4 bytes): uint32
+    - Index (JSON block offsets, variable size)
     - Data blocks (multiple, each with size + compressed data)
+    - Footer (16 bytes): uint64 index offset + uint64 index size
     - Checksum (32 bytes): SHA256
+
+    Version 1 files have no footer; they are still read by scanning blocks.
     """
 
     MAGIC_NUMBER = b'RTER'
-    VERSION = 1
+    VERSION = 2
+    SUPPORTED_VERSIONS = (1, 2)
+    FOOTER_SIZE = 16
+    CHECKSUM_SIZE = 32
 
     def __init__(self):
         """Initialize the RTerrainFormat handler."""
         self.header = {}
         self.data_blocks = {}
         self._data_block_index = {}
+        self._source_path = None
 
     def create_package(
         self,
@@ -51,7 +385,8 @@ class RTerrainFormat:
         osm_data: Optional[Dict] = None,
         vegetation: Optional[Dict] = None,
         tactical: Optional[Dict] = None,
-        profile_config: Optional[Dict] = None
+        profile_config: Optional[Dict] = None,
+        heightmap_scale: Optional[float] = None
     ):
         """
         Create a .rterrain package file.
@@ -66,6 +401,10 @@ class RTerrainFormat:
             vegetation: Vegetation spawn data
             tactical: Tactical analysis data (MILSIM)
             profile_config: Game profile configuration
+            heightmap_scale: Store a float32 heightmap quantized to this
+                step in meters (e.g. HEIGHTMAP_SCALE) and delta-encoded,
+                which compresses far better but is lossy; None (default)
+                stores it exactly
         """
         # Create header
         self.header = self._create_header(
@@ -78,7 +417,9 @@ class RTerrainFormat:
             tactical
         )
 
-        with open(output_path, 'wb') as f:
+        with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as raw:
+            f = _HashingWriter(raw)
+
             # 1. Write magic number
             f.write(self.MAGIC_NUMBER)
 
@@ -86,42 +427,69 @@ class RTerrainFormat:
             f.write(struct.pack('<I', self.VERSION))
 
             # 3. Write header
-            header_json = json.dumps(self.header, indent=2)
-            header_bytes = header_json.encode('utf-8')
+            header_bytes = _dumps(self.header)
             f.write(struct.pack('<I', len(header_bytes)))
             f.write(header_bytes)
 
-            # 4. Write data blocks
+            # 4. Compress data blocks
+            blocks = []
+
             if heightmap is not None:
-                self._write_data_block(f, 'heightmap', heightmap)
+                blocks.append(('heightmap', heightmap))
 
             if satellite is not None:
-                self._write_data_block(f, 'satellite', satellite)
+                blocks.append(('satellite', satellite))
 
             if materials is not None:
                 for name, mask in materials.items():
-                    self._write_data_block(f, f'material_{name}', mask)
+                    blocks.append((f'material_{name}', mask))
 
             if osm_data is not None:
-                self._write_data_block(f, 'osm_data', osm_data)
+                blocks.append(('osm_data', osm_data))
 
             if vegetation is not None:
-                self._write_data_block(f, 'vegetation', vegetation)
+                blocks.append(('vegetation', vegetation))
 
             if tactical is not None:
-                self._write_data_block(f, 'tactical', tactical)
+                blocks.append(('tactical', tactical))
 
             if profile_config is not None:
-                self._write_data_block(f, 'profile', profile_config)
-
-            # 5. Write data block index
-            index_json = json.dumps(self._data_block_index)
-            index_bytes = index_json.encode('utf-8')
+                blocks.append(('profile', profile_config))
+
+            # Every block is compressed before anything after the header is
+            # written: the index precedes the data and needs each block's
+            # compressed size. Peak memory is therefore about the whole
+            # compressed package (the streaming in _compress only avoids
+            # duplicating each block's input and output), the price of a
+            # single-pass write with the index up front.
+            prepared = []
+            if blocks:
+                # Compress blocks concurrently (the codecs release the GIL)
+                workers = min(len(blocks), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    prepared = [
+                        (block_header, _dumps(block_header), compressed)
+                        for block_header, compressed in pool.map(
+                            lambda block: _prepare_block(*block, heightmap_scale), blocks
+                        )
+                    ]
+
+            # 5. Write data block index right after the header, so the whole
+            # file (and its checksum) is still written in a single pass
+            index_offset = f.tell() + 4
+            index_bytes = self._build_index(prepared, index_offset)
             f.write(struct.pack('<I', len(index_bytes)))
             f.write(index_bytes)
 
-            # 6. Write checksum
-            self._write_checksum(f)
+            # 6. Write data blocks in their fixed order
+            for _, block_header_bytes, compressed in prepared:
+                self._write_data_block(f, block_header_bytes, compressed)
+
+            # 7. Write footer so readers can seek straight to the index
+            f.write(struct.pack('<QQ', index_offset, len(index_bytes)))
+
+            # 8. Write checksum (of everything written above)
+            self._write_checksum(raw, f.digest())
 
     def _create_header(
         self,
@@ -176,21 +544,21 @@ class RTerrainFormat:
             header["content"]["satellite"] = True
             header["data_blocks"].append("satellite")
 
-        # Add materials info
+        # Add materials info ("textures" may not exist without satellite)
         if materials is not None:
-            header["textures"]["material_layers"] = list(materials.keys())
+            material_names = list(materials)
+            header.setdefault("textures", {})["material_layers"] = material_names
             header["content"]["materials"] = True
-            for name in materials.keys():
-                header["data_blocks"].append(f"material_{name}")
+            header["data_blocks"].extend(f"material_{name}" for name in material_names)
 
         # Add OSM info
         if osm_data is not None:
-            header["content"]["osm_objects"] = len(osm_data.get('objects', []))
+            header["content"]["osm_objects"] = len(osm_data.get('objects') or ())
             header["data_blocks"].append("osm_data")
 
         # Add vegetation info
         if vegetation is not None:
-            header["content"]["vegetation_spawns"] = len(vegetation.get('spawns', []))
+            header["content"]["vegetation_spawns"] = len(vegetation.get('spawns') or ())
             header["data_blocks"].append("vegetation")
 
         # Add tactical info
@@ -200,87 +568,65 @@ class RTerrainFormat:
 
         return header
 
-    def _write_data_block(self, f: BinaryIO, block_name: str, data: Any):
-        """Write a compressed data block."""
-        start_pos = f.tell()
-
-        # Prepare data for compression
-        if isinstance(data, np.ndarray):
-            # Numpy array - store as bytes
-            data_bytes = data.tobytes()
-            data_type = 'numpy'
-            data_dtype = str(data.dtype)
-            data_shape = list(data.shape)
-        elif isinstance(data, bytes):
-            # Already bytes (e.g., JPEG)
-            data_bytes = data
-            data_type = 'bytes'
-            data_dtype = None
-            data_shape = None
-        else:
-            # JSON-serializable (dict, list, etc.)
-            data_bytes = json.dumps(data).encode('utf-8')
-            data_type = 'json'
-            data_dtype = None
-            data_shape = None
-
-        # Compress
-        compressed = zlib.compress(data_bytes, level=9)
-
-        # Create block header
-        block_header = {
-            'name': block_name,
-            'type': data_type,
-            'dtype': data_dtype,
-            'shape': data_shape,
-            'uncompressed_size': len(data_bytes),
-            'compressed_size': len(compressed),
-            'compression': 'zlib',
-            'checksum': hashlib.md5(compressed).hexdigest()
-        }
+    def _build_index(self, prepared: List[Tuple[Dict, bytes, List[bytes]]], index_offset: int) -> bytes:
+        """
+        Record every block's location in the index and encode it.
 
+        The blocks follow the index, so their offsets depend on its encoded
+        length; the length is grown until the encoded index fits, and any
+        slack is padded with JSON whitespace.
+
+        Args:
+            prepared: (block header, encoded block header, compressed pieces) per block
+            index_offset: File offset at which the index will be written
+
+        Returns:
+            bytes: Encoded index, exactly as long as assumed for the offsets
+        """
+        index_size = 0
+        while True:
+            offset = index_offset + index_size
+            self._data_block_index = {}
+            for block_header, block_header_bytes, compressed in prepared:
+                size = 4 + len(block_header_bytes) + sum(len(piece) for piece in compressed)
+                self._data_block_index[block_header['name']] = {
+                    'offset': offset,
+                    'size': size,
+                    'type': block_header['type'],
+                    'compressed_size': block_header['compressed_size'],
+                    'uncompressed_size': block_header['uncompressed_size']
+                }
+                offset += size
+
+            index_bytes = _dumps(self._data_block_index)
+            if len(index_bytes) <= index_size:
+                return index_bytes.ljust(index_size)
+            index_size = len(index_bytes)
+
+    def _write_data_block(self, f: BinaryIO, block_header_bytes: bytes, compressed: List[bytes]):
+        """Write a data block prepared by _prepare_block."""
         # Write block header
-        block_header_bytes = json.dumps(block_header).encode('utf-8')
         f.write(struct.pack('<I', len(block_header_bytes)))
         f.write(block_header_bytes)
 
         # Write compressed data
-        f.write(compressed)
-
-        # Record in index
-        self._data_block_index[block_name] = {
-            'offset': start_pos,
-            'size': f.tell() - start_pos,
-            'type': data_type,
-            'compressed_size': len(compressed),
-            'uncompressed_size': len(data_bytes)
-        }
-
-    def _write_checksum(self, f: BinaryIO):
-        """Write file checksum."""
-        # Get current position
-        end_pos = f.tell()
-
-        # Seek to beginning and calculate checksum
-        f.seek(0)
-        hasher = hashlib.sha256()
-
-        while f.tell() < end_pos:
-            chunk = f.read(8192)
-            hasher.update(chunk)
-
-        checksum = hasher.digest()
+        for piece in compressed:
+            f.write(piece)
 
-        # Write checksum at end
-        f.seek(end_pos)
+    def _write_checksum(self, f: BinaryIO, checksum: bytes):
+        """Write the file checksum computed while writing the package."""
         f.write(checksum)
 
-    def read_package(self, rterrain_path: str) -> 'RTerrainFormat':
+    def read_package(self, rterrain_path: str, verify: bool = False) -> 'RTerrainFormat':
         """
         Read a .rterrain package file.
 
+        Only the header and block index are read here; data blocks are
+        loaded on first access through the getters.
+
         Args:
             rterrain_path: Path to .rterrain file
+            verify: Also check the whole-file SHA256 checksum
 
         Returns:
             RTerrainFormat: Self with loaded data
@@ -296,103 +642,135 @@ class RTerrainFormat:
 
             # 2. Read version
             version = struct.unpack('<I', f.read(4))[0]
-            if version != self.VERSION:
+            if version not in self.SUPPORTED_VERSIONS:
                 raise ValueError(f"Unsupported version: {version} (expected {self.VERSION})")
 
             # 3. Read header
             header_size = struct.unpack('<I', f.read(4))[0]
             header_bytes = f.read(header_size)
-            self.header = json.loads(header_bytes.decode('utf-8'))
-
-            # 4. Read data blocks
-            file_size = os.path.getsize(rterrain_path)
-
-            # Read until we hit the index (we'll know by size)
-            while f.tell() < file_size - 32:  # Leave room for checksum
-                try:
-                    # Try to read block header size
-                    pos_before = f.tell()
-                    block_header_size_bytes = f.read(4)
-
-                    if len(block_header_size_bytes) < 4:
-                        break
-
-                    block_header_size = struct.unpack('<I', block_header_size_bytes)[0]
-
-                    # Check if this might be the index
-                    if block_header_size > 100000:  # Unreasonably large for a block header
-                        f.seek(pos_before)
-                        break
-
-                    # Read block header
-                    block_header_bytes = f.read(block_header_size)
-                    block_header = json.loads(block_header_bytes.decode('utf-8'))
-
-                    # Read compressed data
-                    compressed = f.read(block_header['compressed_size'])
-
-                    # Verify checksum
-                    checksum = hashlib.md5(compressed).hexdigest()
-                    if checksum != block_header['checksum']:
-                        raise ValueError(f"Checksum mismatch for block {block_header['name']}")
-
-                    # Decompress
-                    data_bytes = zlib.decompress(compressed)
-
-                    # Convert back to original type
-                    if block_header['type'] == 'numpy':
-                        data = np.frombuffer(
-                            data_bytes,
-                            dtype=block_header['dtype']
-                        ).reshape(block_header['shape'])
-                    elif block_header['type'] == 'json':
-                        data = json.loads(data_bytes.decode('utf-8'))
-                    else:  # bytes
-                        data = data_bytes
-
-                    self.data_blocks[block_header['name']] = data
-
-                except Exception as e:
-                    # Probably reached index or checksum
+            self.header = _loads(header_bytes)
+
+            self.data_blocks = {}
+            self._data_block_index = {}
+            self._source_path = rterrain_path
+
+            if version == 1:
+                # 4. No footer: decode every block up front
+                self._scan_blocks(f, os.path.getsize(rterrain_path))
+            else:
+                # 4. Locate the index through the footer
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size - f.tell() < self.FOOTER_SIZE + self.CHECKSUM_SIZE:
+                    raise ValueError("truncated .rterrain file")
+                f.seek(-(self.FOOTER_SIZE + self.CHECKSUM_SIZE), os.SEEK_END)
+                index_offset, index_size = struct.unpack('<QQ', f.read(self.FOOTER_SIZE))
+                f.seek(index_offset)
+                self._data_block_index = _loads(f.read(index_size))
+
+        if verify and not self.verify_checksum():
+            raise ValueError(f"Checksum mismatch for {rterrain_path}")
+
+        return self
+
+    def verify_checksum(self) -> bool:
+        """
+        Check the SHA256 checksum at the end of the loaded package.
+
+        Returns:
+            bool: True if the file contents match the stored checksum
+        """
+        if self._source_path is None:
+            raise ValueError("No package has been read")
+
+        hasher = hashlib.sha256()
+        with open(self._source_path, 'rb') as f:
+            remaining = os.path.getsize(self._source_path) - self.CHECKSUM_SIZE
+            while remaining > 0:
+                chunk = f.read(min(WRITE_BUFFER_SIZE, remaining))
+                if not chunk:
+                    return False
+                hasher.update(chunk)
+                remaining -= len(chunk)
+            return hasher.digest() == f.read(self.CHECKSUM_SIZE)
+
+    def _scan_blocks(self, f: BinaryIO, file_size: int):
+        """Decode all blocks of a version 1 package, which has no footer."""
+        # Read until we hit the index (we'll know by size)
+        while f.tell() < file_size - self.CHECKSUM_SIZE:
+            try:
+                # Try to read block header size
+                pos_before = f.tell()
+                block_header_size_bytes = f.read(4)
+
+                if len(block_header_size_bytes) < 4:
                     break
 
-            # Note: We skip reading the index since we've already read the blocks
-            # The index is mainly for the UE5 plugin to quickly locate blocks
+                block_header_size = struct.unpack('<I', block_header_size_bytes)[0]
 
-        return self
+                # Check if this might be the index
+                if block_header_size > 100000:  # Unreasonably large for a block header
+                    f.seek(pos_before)
+                    break
+
+                block_header = _loads(f.read(block_header_size))
+                compressed = f.read(block_header['compressed_size'])
+                self.data_blocks[block_header['name']] = _decode_block(block_header, compressed)
+
+            except Exception as e:
+                # Probably reached index or checksum
+                break
+
+    def _get_block(self, block_name: str) -> Any:
+        """Return a data block, loading it from the package on first access."""
+        if block_name not in self.data_blocks:
+            entry = self._data_block_index.get(block_name)
+            if entry is None or self._source_path is None:
+                return None
+            # Map the file so the payload is handed to the hasher and the
+            # decompressor as a view instead of being copied into bytes first
+            with open(self._source_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                offset = entry['offset']
+                block_header_size = struct.unpack_from('<I', mm, offset)[0]
+                offset += 4
+                block_header = _loads(mm[offset:offset + block_header_size])
+                offset += block_header_size
+                with memoryview(mm)[offset:offset + block_header['compressed_size']] as payload:
+                    self.data_blocks[block_name] = _decode_block(block_header, payload)
+        return self.data_blocks[block_name]
 
     def get_heightmap(self) -> Optional[np.ndarray]:
         """Get heightmap data."""
-        return self.data_blocks.get('heightmap')
+        return self._get_block('heightmap')
 
     def get_satellite(self) -> Optional[bytes]:
         """Get satellite image data."""
-        return self.data_blocks.get('satellite')
+        return self._get_block('satellite')
 
     def get_material(self, name: str) -> Optional[np.ndarray]:
         """Get material mask by name."""
-        return self.data_blocks.get(f'material_{name}')
+        return self._get_block(f'material_{name}')
 
     def get_all_materials(self) -> Dict[str, np.ndarray]:
         """Get all material masks."""
         materials = {}
-        for key, value in self.data_blocks.items():
+        for key in self.list_data_blocks():
             if key.startswith('material_'):
                 material_name = key[9:]  # Remove 'material_' prefix
-                materials[material_name] = value
+                materials[material_name] = self._get_block(key)
         return materials
 
     def get_osm_data(self) -> Optional[Dict]:
         """Get OSM objects data."""
-        return self.data_blocks.get('osm_data')
+        return self._get_block('osm_data')
 
     def get_vegetation(self) -> Optional[Dict]:
         """Get vegetation spawn data."""
-        return self.data_blocks.get('vegetation')
+        return self._get_block('vegetation')
 
     def get_tactical(self) -> Optional[Dict]:
         """Get tactical analysis data."""
-        return self.data_blocks.get('tactical')
+        return self._get_block('tactical')
 
     def get_metadata(self) -> Dict:
         """Get all metadata from header."""
@@ -400,7 +778,7 @@ class RTerrainFormat:
 
     def list_data_blocks(self) -> list:
         """List all available data blocks."""
-        return list(self.data_blocks.keys())
+        return list(dict.fromkeys([*self.data_blocks, *self._data_block_index]))
 
 
 def create_rterrain_package(
@@ -419,6 +797,7 @@ def create_rterrain_package(
         bbox: Bounding box (min_lon, min_lat, max_lon, max_lat)
         heightmap: Elevation data as numpy array
         **kwargs: Additional data (satellite, materials, osm_data, etc.)
+            and options (heightmap_scale)
 
     Returns:
         str: Path to created .rterrain file
@@ -460,7 +839,8 @@ def create_rterrain_package(
         osm_data=kwargs.get('osm_data'),
         vegetation=kwargs.get('vegetation'),
         tactical=kwargs.get('tactical'),
-        profile_config=kwargs.get('profile_config')
+        profile_config=kwargs.get('profile_config'),
+        heightmap_scale=kwargs.get('heightmap_scale')
     )
 
     return output_path
@@ -5,13 +5,119 @@ Processes and exports satellite imagery as textures for game engines.
 Supports JPEG (compressed), TGA (lossless), and PNG formats.
 """
 
+import io
 import os
+import logging
 import numpy as np
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
-from PIL import Image, ImageEnhance
+from typing import Optional, Tuple, Dict, Any, List
+import PIL
+from PIL import Image, ImageEnhance, ImageStat, features
 import json
 
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Side length of the centre crop encoded to estimate JPEG size
+QUALITY_SAMPLE_SIZE = 1024
+
+# Array size (H * W * 3) from which the numba color correction kernel is
+# used; below this the JIT dispatch overhead outweighs the gain over PIL
+JIT_MIN_SIZE = 4_000_000
+
+
+def _jpeg_backend() -> str:
+    """Describe the JPEG encoder PIL was built with."""
+    turbo_version = features.version_feature('libjpeg_turbo')
+    if turbo_version:
+        backend = f"libjpeg-turbo {turbo_version}"
+    else:
+        backend = f"libjpeg {features.version_codec('jpg') or 'unknown'}"
+
+    # pillow-simd releases carry a '.postN' version suffix
+    if 'post' in PIL.__version__:
+        backend += " (pillow-simd)"
+
+    return backend
+
+
+JPEG_BACKEND = _jpeg_backend()
+logger.debug(f"JPEG encoder: {JPEG_BACKEND}")
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _color_correction_kernel(src, brightness, contrast, saturation, out):
+        """
+        Brightness, contrast and saturation in one pair of passes over src.
+
+        Uses the same float32 blend, truncation and luma weights as PIL's
+        ImageEnhance, so results are identical to the PIL path.
+        """
+        height, width = src.shape[0], src.shape[1]
+        b = np.float32(brightness)
+        c = np.float32(contrast)
+        s = np.float32(saturation)
+
+        # Brightness (blend towards black), summing luma for the contrast mean
+        row_luma = np.zeros(height, dtype=np.int64)
+        for i in prange(height):
+            total = 0
+            for j in range(width):
+                for k in range(3):
+                    v = np.float32(src[i, j, k]) * b
+                    out[i, j, k] = np.uint8(min(max(v, np.float32(0)), np.float32(255)))
+                total += (np.int64(out[i, j, 0]) * 19595 + np.int64(out[i, j, 1]) * 38470
+                          + np.int64(out[i, j, 2]) * 7471 + 0x8000) >> 16
+            row_luma[i] = total
+
+        mean = np.float32(int(row_luma.sum() / (height * width) + 0.5))
+
+        # Contrast (blend towards mean gray), then saturation (towards luma)
+        for i in prange(height):
+            rgb = np.empty(3, dtype=np.int64)
+            for j in range(width):
+                for k in range(3):
+                    v = (np.float32(out[i, j, k]) - mean) * c + mean
+                    rgb[k] = np.int64(min(max(v, np.float32(0)), np.float32(255)))
+                gray = np.float32((rgb[0] * 19595 + rgb[1] * 38470 + rgb[2] * 7471 + 0x8000) >> 16)
+                for k in range(3):
+                    v = (np.float32(rgb[k]) - gray) * s + gray
+                    out[i, j, k] = np.uint8(min(max(v, np.float32(0)), np.float32(255)))
+
+
+# Map method names to PIL constants
+_PIL_RESAMPLE = {
+    'nearest': Image.Resampling.NEAREST,
+    'bilinear': Image.Resampling.BILINEAR,
+    'bicubic': Image.Resampling.BICUBIC,
+    'lanczos': Image.Resampling.LANCZOS
+}
+
+
+def _blend_lut(base: float, alpha: float) -> List[int]:
+    """
+    Build an RGB lookup table for blending every value towards/away from base.
+
+    Reproduces PIL's Image.blend arithmetic (float32, truncated, clipped to
+    0-255) for a constant base image, so brightness (base 0) and contrast
+    (base = mean gray) can be applied with a single Image.point pass.
+    """
+    values = np.arange(256, dtype=np.float32)
+    base = np.float32(base)
+    out = (values - base) * np.float32(alpha) + base
+    return np.clip(out, 0, 255).astype(np.uint8).tolist() * 3
+
 
 class SatelliteExporter:
     """
@@ -50,23 +156,8 @@ class SatelliteExporter:
         Returns:
             str: Path to created JPEG file
         """
-        # Apply color correction if requested
-        if color_correction:
-            imagery = self._apply_color_correction(imagery, color_correction)
-
-        # Convert numpy to PIL Image
-        img = Image.fromarray(imagery, mode='RGB')
-
-        # Save as JPEG
-        img.save(
-            output_path,
-            'JPEG',
-            quality=quality,
-            optimize=optimize,
-            progressive=True  # Progressive JPEG for better web display
-        )
-
-        return output_path
+        img = self._prepare_imagery(imagery, color_correction=color_correction)
+        return self._encode(img, output_path, 'jpeg', quality=quality, optimize=optimize)
 
     def export_tga(
         self,
@@ -85,17 +176,8 @@ class SatelliteExporter:
         Returns:
             str: Path to created TGA file
         """
-        # Apply color correction if requested
-        if color_correction:
-            imagery = self._apply_color_correction(imagery, color_correction)
-
-        # Convert to PIL Image
-        img = Image.fromarray(imagery, mode='RGB')
-
-        # Save as TGA
-        img.save(output_path, 'TGA')
-
-        return output_path
+        img = self._prepare_imagery(imagery, color_correction=color_correction)
+        return self._encode(img, output_path, 'tga')
 
     def export_png(
         self,
@@ -116,15 +198,78 @@ class SatelliteExporter:
         Returns:
             str: Path to created PNG file
         """
-        # Apply color correction if requested
-        if color_correction:
+        img = self._prepare_imagery(imagery, color_correction=color_correction)
+        return self._encode(img, output_path, 'png', optimize=optimize)
+
+    def _prepare_imagery(
+        self,
+        imagery: np.ndarray,
+        target_size: Optional[Tuple[int, int]] = None,
+        color_correction: Optional[Dict[str, float]] = None
+    ) -> Image.Image:
+        """
+        Resize and color-correct imagery, converting it to PIL only once.
+
+        Args:
+            imagery: RGB imagery as numpy array (H, W, 3) uint8
+            target_size: Optional target (height, width)
+            color_correction: Optional color correction
+
+        Returns:
+            PIL.Image.Image: Image ready for encoding
+        """
+        # Large images are corrected by the numba kernel, which works on the
+        # array, so they are resized and corrected before converting
+        use_jit = bool(color_correction) and NUMBA_AVAILABLE and imagery.size >= JIT_MIN_SIZE
+
+        # cv2 resizes the numpy array directly; otherwise resize after converting
+        if target_size is not None and (CV2_AVAILABLE or use_jit):
+            imagery = self.match_dimensions(imagery, target_size)
+
+        if use_jit:
             imagery = self._apply_color_correction(imagery, color_correction)
 
-        # Convert to PIL Image
         img = Image.fromarray(imagery, mode='RGB')
 
-        # Save as PNG
-        img.save(output_path, 'PNG', optimize=optimize)
+        if target_size is not None and img.size != (target_size[1], target_size[0]):
+            img = img.resize((target_size[1], target_size[0]), Image.Resampling.BILINEAR)
+
+        if color_correction and not use_jit:
+            img = self._correct_image(img, color_correction)
+
+        return img
+
+    def _encode(self, img: Image.Image, output_path: str, format: str, **kwargs) -> str:
+        """
+        Save a prepared image in the given format.
+
+        Args:
+            img: Image from _prepare_imagery
+            output_path: Output file path
+            format: Export format ('jpeg', 'tga', 'png')
+            **kwargs: 'quality'/'optimize' for JPEG, 'optimize' for PNG
+
+        Returns:
+            str: Path to created file
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        format = format.lower()
+        if format == 'jpeg':
+            img.save(
+                output_path,
+                'JPEG',
+                quality=kwargs.get('quality', 90),
+                optimize=kwargs.get('optimize', True),
+                progressive=True  # Progressive JPEG for better web display
+            )
+        elif format == 'tga':
+            img.save(output_path, 'TGA')
+        elif format == 'png':
+            img.save(output_path, 'PNG', optimize=kwargs.get('optimize', True))
+        else:
+            raise ValueError(f"Unsupported format: {format}")
 
         return output_path
 
@@ -145,21 +290,35 @@ class SatelliteExporter:
         Returns:
             numpy.ndarray: Resized imagery
         """
+        target_height, target_width = target_size
+
+        # OpenCV's SIMD/multithreaded resize is much faster on large textures
+        if CV2_AVAILABLE:
+            height, width = imagery.shape[:2]
+            if method == 'nearest':
+                interpolation = cv2.INTER_NEAREST_EXACT
+            elif target_height <= height and target_width <= width:
+                # Area averaging matches PIL's antialiased downscaling;
+                # cv2's bilinear/bicubic would alias
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = {
+                    'bicubic': cv2.INTER_CUBIC,
+                    'lanczos': cv2.INTER_LANCZOS4
+                }.get(method, cv2.INTER_LINEAR)
+
+            return cv2.resize(
+                np.ascontiguousarray(imagery),
+                (target_width, target_height),
+                interpolation=interpolation
+            )
+
         # Convert to PIL
         img = Image.fromarray(imagery, mode='RGB')
 
-        # Map method names to PIL constants
-        resample_methods = {
-            'nearest': Image.Resampling.NEAREST,
-            'bilinear': Image.Resampling.BILINEAR,
-            'bicubic': Image.Resampling.BICUBIC,
-            'lanczos': Image.Resampling.LANCZOS
-        }
-
-        resample = resample_methods.get(method, Image.Resampling.BILINEAR)
+        resample = _PIL_RESAMPLE.get(method, Image.Resampling.BILINEAR)
 
         # Resize (PIL uses (width, height))
-        target_height, target_width = target_size
         resized = img.resize((target_width, target_height), resample)
 
         # Convert back to numpy
@@ -180,20 +339,43 @@ class SatelliteExporter:
         Returns:
             numpy.ndarray: Corrected imagery
         """
+        if NUMBA_AVAILABLE and imagery.size >= JIT_MIN_SIZE:
+            # A factor of 1.0 leaves values unchanged, same as skipping it
+            out = np.empty_like(imagery)
+            _color_correction_kernel(
+                np.ascontiguousarray(imagery),
+                correction.get('brightness', 1.0),
+                correction.get('contrast', 1.0),
+                correction.get('saturation', 1.0),
+                out
+            )
+            return out
+
         # Convert to PIL
         img = Image.fromarray(imagery, mode='RGB')
 
+        # Convert back to numpy
+        return np.array(self._correct_image(img, correction))
+
+    def _correct_image(
+        self,
+        img: Image.Image,
+        correction: Dict[str, float]
+    ) -> Image.Image:
+        """Apply color correction to a PIL image (see _apply_color_correction)."""
+        # Brightness and contrast are per-value mappings, so apply them as
+        # lookup tables (same result as ImageEnhance, one cheap pass each)
+
         # Apply brightness
         if 'brightness' in correction:
             brightness = correction['brightness']
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(brightness)
+            img = img.point(_blend_lut(0, brightness))
 
-        # Apply contrast
+        # Apply contrast (around the mean gray level, like ImageEnhance)
         if 'contrast' in correction:
             contrast = correction['contrast']
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(contrast)
+            mean = int(ImageStat.Stat(img.convert('L')).mean[0] + 0.5)
+            img = img.point(_blend_lut(mean, contrast))
 
         # Apply saturation
         if 'saturation' in correction:
@@ -201,8 +383,7 @@ class SatelliteExporter:
             enhancer = ImageEnhance.Color(img)
             img = enhancer.enhance(saturation)
 
-        # Convert back to numpy
-        return np.array(img)
+        return img
 
     def create_metadata(
         self,
@@ -218,7 +399,7 @@ class SatelliteExporter:
         Create metadata file for satellite texture.
 
         Args:
-            imagery: The imagery array
+            imagery: The imagery array (or prepared PIL image)
             bbox: Bounding box
             output_path: Path to metadata file
             format: Export format
@@ -229,7 +410,10 @@ class SatelliteExporter:
         Returns:
             str: Path to metadata file
         """
-        height, width = imagery.shape[:2]
+        if isinstance(imagery, Image.Image):
+            width, height = imagery.size
+        else:
+            height, width = imagery.shape[:2]
 
         metadata = {
             'type': 'satellite_texture',
@@ -301,40 +485,20 @@ class SatelliteExporter:
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
 
-        # Match dimensions if requested
-        if match_heightmap_size is not None:
-            imagery = self.match_dimensions(imagery, match_heightmap_size)
+        if format.lower() not in ('jpeg', 'tga', 'png'):
+            raise ValueError(f"Unsupported format: {format}")
 
         # Determine output paths
         texture_path = os.path.join(output_dir, f"{base_name}.{format.lower()}")
         metadata_path = os.path.join(output_dir, f"{base_name}_meta.json")
 
-        # Export based on format
-        if format.lower() == 'jpeg':
-            self.export_jpeg(
-                imagery,
-                texture_path,
-                quality=quality,
-                color_correction=color_correction
-            )
-        elif format.lower() == 'tga':
-            self.export_tga(
-                imagery,
-                texture_path,
-                color_correction=color_correction
-            )
-        elif format.lower() == 'png':
-            self.export_png(
-                imagery,
-                texture_path,
-                color_correction=color_correction
-            )
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        # Match dimensions and correct colors, then encode the single result
+        img = self._prepare_imagery(imagery, match_heightmap_size, color_correction)
+        self._encode(img, texture_path, format, quality=quality)
 
         # Create metadata
         self.create_metadata(
-            imagery,
+            img,
             bbox,
             metadata_path,
             format=format,
@@ -368,14 +532,23 @@ class SatelliteExporter:
         Returns:
             int: Recommended JPEG quality (0-100)
         """
-        # Test with quality 90
-        test_path = 'temp_quality_test.jpg'
-
         try:
-            img = Image.fromarray(imagery, mode='RGB')
-            img.save(test_path, 'JPEG', quality=90)
+            # Test with quality 90 on a centre crop, in memory. A crop keeps
+            # the per-pixel JPEG cost (a downscaled copy would not), so the
+            # full size scales with pixel count.
+            height, width = imagery.shape[:2]
+            top = max(0, (height - QUALITY_SAMPLE_SIZE) // 2)
+            left = max(0, (width - QUALITY_SAMPLE_SIZE) // 2)
+            sample = np.ascontiguousarray(
+                imagery[top:top + QUALITY_SAMPLE_SIZE, left:left + QUALITY_SAMPLE_SIZE]
+            )
 
-            test_size_mb = os.path.getsize(test_path) / (1024 * 1024)
+            buffer = io.BytesIO()
+            img = Image.fromarray(sample, mode='RGB')
+            img.save(buffer, 'JPEG', quality=90)
+
+            pixel_ratio = (height * width) / (sample.shape[0] * sample.shape[1])
+            test_size_mb = buffer.tell() * pixel_ratio / (1024 * 1024)
 
             # Estimate quality needed
             if test_size_mb <= target_size_mb:
@@ -386,9 +559,6 @@ class SatelliteExporter:
                 recommended_quality = int(90 * ratio)
                 recommended_quality = max(60, min(95, recommended_quality))
 
-            # Clean up
-            os.remove(test_path)
-
             return recommended_quality
 
         except Exception as e:
@@ -0,0 +1,199 @@
+"""
+Hardware Fingerprint Generation (implementation)
+
+Imported on first use through hardware_fingerprint, so hashlib, platform
+and uuid are not loaded until a fingerprint is actually needed.
+"""
+
+import hashlib
+import os
+import platform
+import sys
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+
+from .hardware_fingerprint import validate_fingerprint
+
+# Serializes the first computation, which may run on a prefetch thread
+# while the GUI thread asks for the same fingerprint
+_FINGERPRINT_LOCK = threading.Lock()
+
+# Platform queries by component name, in fingerprint order
+_PLATFORM_SOURCES = (
+    ("mac", uuid.getnode),          # MAC address (most stable identifier)
+    ("node", platform.node),        # Machine name
+    ("processor", platform.processor),
+    ("system", platform.system),
+)
+
+# Fingerprint cached between QGIS sessions. The scheme version in the name
+# drops old caches whenever the fingerprint inputs change.
+FINGERPRINT_CACHE_PATH = Path.home() / ".realterrain" / "fingerprint-v2.cache"
+
+# Seconds before the cached fingerprint is recomputed, so hardware changes
+# are eventually picked up (the plugin's startup prefetch absorbs the cost)
+FINGERPRINT_CACHE_MAX_AGE = 7 * 86400
+
+
+@lru_cache(maxsize=1)
+def _collect_platform_components() -> dict:
+    """
+    Query the platform details used by the fingerprint and machine info.
+
+    Done once per process and shared, so each (possibly slow) platform
+    query runs only once. Values that could not be determined are None.
+
+    Returns:
+        dict: 'mac', 'node', 'processor', 'system', 'version', 'machine'
+    """
+    components = {}
+
+    for name, source in _PLATFORM_SOURCES:
+        try:
+            value = source()
+            components[name] = str(value) if value is not None else None
+        except Exception:
+            components[name] = None
+
+    # Display-only details
+    components["version"] = platform.version()
+    components["machine"] = platform.machine()
+
+    return components
+
+
+@lru_cache(maxsize=2)
+def get_hardware_fingerprint(include_platform: bool = False) -> str:
+    """
+    Generate a unique hardware fingerprint for this machine.
+
+    Uses multiple stable hardware identifiers to create a unique hash.
+    This fingerprint should remain constant across reboots but may change
+    if significant hardware changes occur. Computed once per process, and
+    cached on disk so later sessions skip the slower platform queries.
+
+    Args:
+        include_platform: Also hash platform.platform(), as fingerprints
+            issued before it was dropped did (slow on Windows; only needed
+            to recognise those older IDs; never cached on disk)
+
+    Returns:
+        str: 32-character hexadecimal hardware fingerprint
+    """
+    with _FINGERPRINT_LOCK:
+        if include_platform:
+            return _compute_fingerprint(include_platform=True)
+
+        # A caller that waited on the lock finds the fingerprint the first
+        # one just cached, rather than computing it again
+        machine_key = _machine_key()
+        fingerprint = _read_cached_fingerprint(machine_key)
+        if fingerprint is None:
+            fingerprint = _compute_fingerprint()
+            _write_cached_fingerprint(machine_key, fingerprint)
+
+        return fingerprint
+
+
+def _machine_key() -> str:
+    """
+    Cheap identity (host name, OS and CPU count) stored with the cached
+    fingerprint, so a cache copied from another machine is not used.
+
+    Deliberately avoids the MAC address: uuid.getnode() is one of the slow
+    probes the cache exists to skip, and falls back to a random value on
+    machines without one, which would never match.
+    """
+    return f"{platform.node()}|{sys.platform}|{os.cpu_count()}"
+
+
+def _read_cached_fingerprint(machine_key: str):
+    """Return the cached fingerprint if it is recent and was written for this machine, else None."""
+    try:
+        if time.time() - FINGERPRINT_CACHE_PATH.stat().st_mtime >= FINGERPRINT_CACHE_MAX_AGE:
+            return None
+        cached_key, fingerprint = FINGERPRINT_CACHE_PATH.read_text(encoding="utf-8").splitlines()
+    except (OSError, ValueError):
+        return None
+
+    if cached_key != machine_key or not validate_fingerprint(fingerprint):
+        return None
+
+    return fingerprint
+
+
+def _write_cached_fingerprint(machine_key: str, fingerprint: str):
+    """Cache the fingerprint on disk; failures only cost a recompute next time."""
+    try:
+        FINGERPRINT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        FINGERPRINT_CACHE_PATH.write_text(f"{machine_key}\n{fingerprint}\n", encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _compute_fingerprint(include_platform: bool = False) -> str:
+    """
+    Hash the platform components into a fingerprint (see get_hardware_fingerprint).
+
+    Args:
+        include_platform: Also hash platform.platform()
+
+    Returns:
+        str: 32-character hexadecimal hardware fingerprint
+    """
+    platform_components = _collect_platform_components()
+    components = [
+        platform_components[name]
+        for name, _ in _PLATFORM_SOURCES
+        if platform_components[name]
+    ]
+
+    # Platform
+    if include_platform:
+        try:
+            plat = platform.platform()
+            if plat:
+                components.append(plat)
+        except Exception:
+            pass
+
+    # If we couldn't get any components, use a fallback
+    if not components:
+        components.append("fallback-unknown-machine")
+
+    # Hash the components joined by "|", feeding them to the hasher directly
+    # (SHA-256 is kept so IDs stay the same as those already stored with
+    # activated licenses; only the first 16 bytes are hex-encoded)
+    hasher = hashlib.sha256()
+    for i, component in enumerate(components):
+        if i:
+            hasher.update(b"|")
+        hasher.update(component.encode())
+    fingerprint = hasher.digest()[:16].hex()
+
+    return fingerprint
+
+
+def get_machine_info() -> dict:
+    """
+    Get human-readable machine information for display.
+
+    Returns:
+        dict: Machine information including platform, processor, etc.
+    """
+    components = _collect_platform_components()
+
+    info = {
+        "platform": components["system"],
+        "platform_version": components["version"],
+        "machine": components["machine"],
+        "processor": components["processor"],
+        "node": components["node"],
+        "fingerprint": get_hardware_fingerprint()
+    }
+
+    return info
+
@@ -0,0 +1,58 @@
+"""
+Background License Validation
+
+Runs the backend check of a license key on Qt's global thread pool, so
+network round trips and retry back-off never block the QGIS UI.
+"""
+
+import logging
+
+from qgis.PyQt.QtCore import QObject, QRunnable, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class ValidateLicenseSignals(QObject):
+    """Signals emitted by ValidateLicenseTask."""
+
+    finished = pyqtSignal(str, bool, str)  # Emits license key, success, message
+
+
+class ValidateLicenseTask(QRunnable):
+    """
+    Validate a license key with the backend on a worker thread.
+
+    Only validation runs in the background; connect to signals.finished
+    and call LicenseManager.store_activated_license() there to store it.
+    """
+
+    def __init__(self, license_manager, license_key: str):
+        """
+        Initialize the task.
+
+        Args:
+            license_manager: LicenseManager used for the validation
+            license_key: The license key to validate
+        """
+        super().__init__()
+        self.license_manager = license_manager
+        self.license_key = license_key
+
+        # Created on the calling (GUI) thread, so connected slots run there
+        self.signals = ValidateLicenseSignals()
+
+        # Resolve the lazy hardware ID now; it reads the manager's own
+        # QSettings object, which belongs to this thread. (The backend
+        # result cache opens separate QSettings objects on the worker
+        # thread; QSettings is reentrant, so distinct objects are safe.)
+        license_manager.hardware_id
+
+    def run(self):
+        """Validate the key and emit the result."""
+        try:
+            success, message = self.license_manager.validate_license(self.license_key)
+        except Exception as e:
+            logger.exception(f"License validation task failed: {e}")
+            success, message = False, "License validation failed. Please try again later."
+
+        self.signals.finished.emit(self.license_key, success, message)
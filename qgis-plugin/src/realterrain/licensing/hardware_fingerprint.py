@@ -3,75 +3,31 @@ Hardware Fingerprint Generation
 
 Generates a unique hardware ID for license validation.
 Uses non-invasive system information that remains stable.
+
+The fingerprinting itself lives in _fingerprint_impl and is imported on
+first call, keeping this module cheap to import with the licensing package.
 """
 
-import hashlib
-import platform
-import uuid
-from typing import Optional
+import re
+
+_FINGERPRINT_PATTERN = re.compile(r'[0-9a-fA-F]{32}')
 
 
-def get_hardware_fingerprint() -> str:
+def get_hardware_fingerprint(include_platform: bool = False) -> str:
     """
     Generate a unique hardware fingerprint for this machine.
 
-    Uses multiple stable hardware identifiers to create a unique hash.
-    This fingerprint should remain constant across reboots but may change
-    if significant hardware changes occur.
+    Computed once per process and cached on disk between sessions.
+
+    Args:
+        include_platform: Also hash platform.platform(), as fingerprints
+            issued before it was dropped did
 
     Returns:
         str: 32-character hexadecimal hardware fingerprint
     """
-    components = []
-
-    # MAC address (most stable identifier)
-    try:
-        mac = uuid.getnode()
-        components.append(str(mac))
-    except Exception:
-        pass
-
-    # Machine name
-    try:
-        machine = platform.node()
-        if machine:
-            components.append(machine)
-    except Exception:
-        pass
-
-    # Processor info
-    try:
-        processor = platform.processor()
-        if processor:
-            components.append(processor)
-    except Exception:
-        pass
-
-    # System info
-    try:
-        system = platform.system()
-        if system:
-            components.append(system)
-    except Exception:
-        pass
-
-    # Platform
-    try:
-        plat = platform.platform()
-        if plat:
-            components.append(plat)
-    except Exception:
-        pass
-
-    # If we couldn't get any components, use a fallback
-    if not components:
-        components.append("fallback-unknown-machine")
-
-    # Combine all components and hash
-    combined = "|".join(components)
-    fingerprint = hashlib.sha256(combined.encode()).hexdigest()[:32]
-
-    return fingerprint
+    from ._fingerprint_impl import get_hardware_fingerprint as _get_hardware_fingerprint
+    return _get_hardware_fingerprint(include_platform)
 
 
 def get_machine_info() -> dict:
@@ -81,16 +37,8 @@ def get_machine_info() -> dict:
     Returns:
         dict: Machine information including platform, processor, etc.
     """
-    info = {
-        "platform": platform.system(),
-        "platform_version": platform.version(),
-        "machine": platform.machine(),
-        "processor": platform.processor(),
-        "node": platform.node(),
-        "fingerprint": get_hardware_fingerprint()
-    }
-
-    return info
+    from ._fingerprint_impl import get_machine_info as _get_machine_info
+    return _get_machine_info()
 
 
 def validate_fingerprint(fingerprint: str) -> bool:
@@ -103,15 +51,5 @@ def validate_fingerprint(fingerprint: str) -> bool:
     Returns:
         bool: True if valid format, False otherwise
     """
-    if not fingerprint or not isinstance(fingerprint, str):
-        return False
-
-    if len(fingerprint) != 32:
-        return False
-
-    # Check if it's hexadecimal
-    try:
-        int(fingerprint, 16)
-        return True
-    except ValueError:
-        return False
+    # Exactly 32 hexadecimal characters (the pattern is compiled at import)
+    return isinstance(fingerprint, str) and _FINGERPRINT_PATTERN.fullmatch(fingerprint) is not None
@@ -4,21 +4,23 @@ License Manager
 Handles license validation, storage, and communication with Supabase backend.
 """
 
-import os
-import json
-import base64
+import hashlib
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Tuple
-from pathlib import Path
+import re
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
 
 from qgis.PyQt.QtCore import QSettings
 
 from .hardware_fingerprint import get_hardware_fingerprint
 
-# Import error handling utilities
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Error handling utilities (the top-level utils package, installed next to
+# realterrain by setup.py)
 from utils.error_handling import (
     LicenseError,
     NetworkError,
@@ -31,31 +33,88 @@ from utils.error_handling import (
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Seconds a computed license status is reused before settings are re-read
+STATUS_CACHE_TTL = 60.0
+
+# Export limits per tier (read-only, shared by every manager)
+FREE_TIER_LIMITS = MappingProxyType({
+    "max_area_km2": 10,
+    "monthly_exports": 10,
+    "max_resolution_m": 30,
+})
+PRO_TIER_LIMITS = MappingProxyType({
+    "max_area_km2": "Unlimited",
+    "monthly_exports": "Unlimited",
+    "max_resolution_m": "1m (highest available)",
+})
+
+# Seconds a successful backend validation is trusted, across sessions
+BACKEND_CACHE_TTL = 24 * 3600
+
+# License key characters once dashes are removed and the key is upper-cased
+_KEY_RE = re.compile(r'[A-Z0-9]{16}')
+
+# Keys accepted offline by the mock backend validation
+_TEST_KEYS = frozenset({
+    "TEST-1234-5678-ABCD",
+    "DEMO-ABCD-1234-EFGH",
+})
+
 
 class LicenseStatus:
-    """License status constants."""
-    FREE = "free"
-    PRO = "pro"
-    EXPIRED = "expired"
-    INVALID = "invalid"
-    NOT_ACTIVATED = "not_activated"
+    """
+    License status constants.
+
+    Interned, so a status passed around the plugin is always one of these
+    exact objects and == compares settle on the identity check.
+    """
+    FREE = sys.intern("free")
+    PRO = sys.intern("pro")
+    EXPIRED = sys.intern("expired")
+    INVALID = sys.intern("invalid")
+    NOT_ACTIVATED = sys.intern("not_activated")
 
 
 class LicenseManager:
     """Manages license validation and storage."""
 
+    # Backend validations in progress, by normalized key, shared by all
+    # managers so concurrent attempts for one key make a single request
+    _inflight: Dict[str, Future] = {}
+    _inflight_lock = threading.Lock()
+
+    # Bumped whenever any manager stores or removes the license, so the
+    # status and info cached by every other manager are dropped as well
+    _license_version = 0
+
+    # License limits (Free tier)
+    FREE_TIER_LIMITS = FREE_TIER_LIMITS
+
     def __init__(self):
         """Initialize the license manager."""
         try:
             self.settings = QSettings("RealTerrainStudio", "QGIS")
-            self.hardware_id = get_hardware_fingerprint()
 
-            # License limits (Free tier)
-            self.FREE_TIER_LIMITS = {
-                "max_area_km2": 10,
-                "monthly_exports": 10,
-                "max_resolution_m": 30,
-            }
+            # Fingerprinted on first access, see the hardware_id property
+            self._hardware_id = None
+
+            # Last computed license status, when it was computed and the
+            # _license_version it was computed under
+            self._status_cache = None
+            self._status_cache_ts = 0.0
+            self._status_cache_version = -1
+
+            # get_license_info() result, reused while _license_version is
+            # unchanged
+            self._info_cache = None
+            self._info_cache_version = -1
+
+            # Startup reads done in one pass: the first-run flag, and the
+            # stored key for the first status check (None once consumed,
+            # ignored once any manager has changed the license since)
+            self._first_run = self.settings.value("app/first_run", True, type=bool)
+            self._stored_key = self.settings.value("license/key", "")
+            self._stored_key_version = LicenseManager._license_version
 
             logger.info("License manager initialized successfully")
 
@@ -66,48 +125,150 @@ class LicenseManager:
                 user_message="Could not initialize licensing system. Please restart QGIS."
             )
 
+    @property
+    def hardware_id(self) -> str:
+        """
+        Hardware fingerprint of this machine, computed on first access.
+
+        Returns:
+            str: 32-character hexadecimal hardware ID
+        """
+        if self._hardware_id is None:
+            hardware_id = get_hardware_fingerprint()
+
+            # Licenses activated before platform.platform() was dropped from
+            # the fingerprint stay bound to the ID they were activated with
+            stored_id = self.settings.value("license/hardware_id", "")
+            if stored_id and stored_id != hardware_id:
+                if stored_id == get_hardware_fingerprint(include_platform=True):
+                    hardware_id = stored_id
+
+            self._hardware_id = hardware_id
+        return self._hardware_id
+
     @handle_errors(default_return=LicenseStatus.FREE)
     def get_license_status(self) -> str:
         """
         Get current license status.
 
+        The result is reused for STATUS_CACHE_TTL seconds, or until the
+        license is activated or deactivated through any manager.
+
         Returns:
             str: One of LicenseStatus constants
         """
         try:
-            # Check if license key exists
-            license_key = self.settings.value("license/key", "")
-
-            if not license_key:
-                # No license key - using free version
-                logger.debug("No license key found, using free tier")
-                return LicenseStatus.FREE
-
-            # Validate stored license
-            is_valid, status = self._validate_stored_license()
-
-            if not is_valid:
-                logger.warning(f"License validation failed: {status}")
+            status = self._cached_status()
+            if status is not None:
                 return status
 
-            logger.debug("Pro license validated successfully")
-            return LicenseStatus.PRO
+            version = LicenseManager._license_version
+            self._status_cache = self._read_license_status()
+            self._status_cache_ts = time.monotonic()
+            self._status_cache_version = version
+            return self._status_cache
 
         except Exception as e:
             logger.error(f"Error checking license status: {e}")
             # Default to free tier on error
             return LicenseStatus.FREE
 
+    def _cached_status(self) -> Optional[str]:
+        """Return the cached license status, or None if it is stale."""
+        if (
+            self._status_cache is not None
+            and self._status_cache_version == LicenseManager._license_version
+            and time.monotonic() - self._status_cache_ts < STATUS_CACHE_TTL
+        ):
+            return self._status_cache
+        return None
+
+    def _read_license_status(self) -> str:
+        """Determine the license status from the stored settings."""
+        # Check if license key exists (the first check uses the key read
+        # at startup unless the license changed since; later ones re-read it)
+        license_key = self._stored_key
+        self._stored_key = None
+        if license_key is None or self._stored_key_version != LicenseManager._license_version:
+            license_key = self.settings.value("license/key", "")
+
+        if not license_key:
+            # No license key - using free version
+            logger.debug("No license key found, using free tier")
+            return LicenseStatus.FREE
+
+        # Validate stored license
+        is_valid, status = self._validate_stored_license(license_key)
+
+        if not is_valid:
+            logger.warning(f"License validation failed: {status}")
+            return status
+
+        logger.debug("Pro license validated successfully")
+        return LicenseStatus.PRO
+
     def activate_license(self, license_key: str) -> Tuple[bool, str]:
         """
         Activate a license key.
 
+        Validates the key with the backend and stores it. The dialog runs
+        the two steps separately (see activation_task) so the backend call
+        happens off the GUI thread.
+
         Args:
             license_key: The license key to activate
 
         Returns:
             Tuple[bool, str]: (success, message)
         """
+        success, message = self.validate_license(license_key)
+        if not success:
+            return False, message
+
+        return self.store_activated_license(license_key)
+
+    def validate_license(self, license_key: str) -> Tuple[bool, str]:
+        """
+        Check a license key's format and validate it with the backend.
+
+        The license is not stored, and the manager's own QSettings object
+        is not used once hardware_id has been resolved (the backend result
+        cache opens its own), so this is safe to call from a worker thread. A
+        call for a key that is already being validated waits for and
+        shares that result instead of contacting the backend again.
+
+        Args:
+            license_key: The license key to validate
+
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        inflight_key = (license_key or "").strip().upper()
+
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[inflight_key] = future
+
+        if not owner:
+            logger.debug("License validation already in progress, waiting for its result")
+            return future.result()
+
+        try:
+            result = self._validate_license(license_key)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[inflight_key]
+
+    def _validate_license(self, license_key: str) -> Tuple[bool, str]:
+        """Validate a license key (see validate_license)."""
         try:
             # Validate input
             if not license_key or len(license_key.strip()) == 0:
@@ -116,15 +277,23 @@ class LicenseManager:
 
             # Format and validate key format
             license_key = license_key.strip().upper()
-            logger.info(f"Attempting to activate license: {self._mask_license_key(license_key)}")
+            logger.info("Attempting to activate license: %s", self._mask_license_key(license_key))
 
             if not self._validate_key_format(license_key):
-                logger.warning(f"Invalid license key format: {self._mask_license_key(license_key)}")
+                logger.warning("Invalid license key format: %s", self._mask_license_key(license_key))
                 return False, "Invalid license key format. Expected: XXXX-XXXX-XXXX-XXXX"
 
-            # Validate against Supabase backend (with retry)
+            # Validate against Supabase backend (with retry), unless it
+            # accepted this key on this machine within BACKEND_CACHE_TTL
             try:
-                success, message = self._validate_with_backend(license_key)
+                cached = self._cached_backend_result(license_key)
+                if cached is not None:
+                    logger.debug("Using cached backend validation")
+                    success, message = cached
+                else:
+                    success, message = self._validate_with_backend(license_key)
+                    if success:
+                        self._cache_backend_result(license_key, message)
             except NetworkError as e:
                 logger.error(f"Network error during license validation: {e}")
                 return False, e.user_message
@@ -132,23 +301,33 @@ class LicenseManager:
                 logger.error(f"Unexpected error during license validation: {e}")
                 return False, "License validation failed. Please try again later."
 
-            if success:
-                # Store license information
-                try:
-                    self._store_license(license_key)
-                    logger.info("License activated and stored successfully")
-                    return True, "License activated successfully!"
-                except Exception as e:
-                    logger.error(f"Failed to store license: {e}")
-                    return False, "License validation succeeded but storage failed. Please try again."
-
-            logger.warning(f"License validation failed: {message}")
-            return False, message
+            if not success:
+                logger.warning(f"License validation failed: {message}")
+            return success, message
 
         except Exception as e:
-            logger.exception(f"Unexpected error in activate_license: {e}")
+            logger.exception(f"Unexpected error in validate_license: {e}")
             return False, f"An unexpected error occurred: {str(e)}"
 
+    def store_activated_license(self, license_key: str) -> Tuple[bool, str]:
+        """
+        Store a license key that validate_license accepted.
+
+        Args:
+            license_key: The validated license key
+
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        try:
+            self._store_license(license_key.strip().upper())
+            self._license_changed()
+            logger.info("License activated and stored successfully")
+            return True, "License activated successfully!"
+        except Exception as e:
+            logger.error(f"Failed to store license: {e}")
+            return False, "License validation succeeded but storage failed. Please try again."
+
     @handle_errors(default_return=False)
     def deactivate_license(self) -> bool:
         """
@@ -159,11 +338,14 @@ class LicenseManager:
         """
         try:
             logger.info("Deactivating license")
-            self.settings.remove("license/key")
-            self.settings.remove("license/activated_date")
-            self.settings.remove("license/user_email")
-            self.settings.remove("license/hardware_id")
+            self.settings.beginGroup("license")
+            try:
+                for k in ("key", "activated_date", "user_email", "hardware_id", "backend_cache"):
+                    self.settings.remove(k)
+            finally:
+                self.settings.endGroup()
             self.settings.sync()
+            self._license_changed()
             logger.info("License deactivated successfully")
             return True
 
@@ -171,15 +353,29 @@ class LicenseManager:
             logger.error(f"Failed to deactivate license: {e}")
             return False
 
+    def _license_changed(self):
+        """Drop cached status and info after the stored license changed."""
+        self._status_cache = None
+        self._stored_key = None
+        LicenseManager._license_version += 1
+
     def get_license_info(self) -> Dict:
         """
         Get detailed license information.
 
+        The dict is reused until the license status changes, so callers
+        should treat it as read-only.
+
         Returns:
             dict: License information including status, limits, etc.
         """
         status = self.get_license_status()
 
+        version = LicenseManager._license_version
+        info = self._info_cache
+        if info is not None and self._info_cache_version == version and info["status"] == status:
+            return info
+
         info = {
             "status": status,
             "hardware_id": self.hardware_id,
@@ -191,19 +387,21 @@ class LicenseManager:
             info["message"] = "Using free version with limited features"
 
         elif status == LicenseStatus.PRO:
-            license_key = self.settings.value("license/key", "")
-            activated_date = self.settings.value("license/activated_date", "")
-            user_email = self.settings.value("license/user_email", "")
+            # Read the stored license fields in one pass over the group
+            self.settings.beginGroup("license")
+            try:
+                data = {
+                    k: self.settings.value(k, "")
+                    for k in ("key", "activated_date", "user_email")
+                }
+            finally:
+                self.settings.endGroup()
 
             info["tier"] = "Pro"
-            info["license_key"] = self._mask_license_key(license_key)
-            info["activated_date"] = activated_date
-            info["user_email"] = user_email
-            info["limits"] = {
-                "max_area_km2": "Unlimited",
-                "monthly_exports": "Unlimited",
-                "max_resolution_m": "1m (highest available)",
-            }
+            info["license_key"] = self._mask_license_key(data["key"])
+            info["activated_date"] = data["activated_date"]
+            info["user_email"] = data["user_email"]
+            info["limits"] = PRO_TIER_LIMITS
             info["message"] = "Pro license active"
 
         elif status == LicenseStatus.EXPIRED:
@@ -214,6 +412,8 @@ class LicenseManager:
             info["tier"] = "Invalid"
             info["message"] = "License validation failed. Please contact support."
 
+        self._info_cache = info
+        self._info_cache_version = version
         return info
 
     def check_export_allowed(self, area_km2: float) -> Tuple[bool, str]:
@@ -226,7 +426,11 @@ class LicenseManager:
         Returns:
             Tuple[bool, str]: (allowed, message)
         """
-        status = self.get_license_status()
+        # Areas within the free limit pass on either tier, so a status
+        # already known to be Pro or Free settles them without revalidating
+        status = self._cached_status()
+        if area_km2 > self.FREE_TIER_LIMITS["max_area_km2"] or status not in (LicenseStatus.PRO, LicenseStatus.FREE):
+            status = self.get_license_status()
 
         if status == LicenseStatus.PRO:
             return True, "Export allowed"
@@ -251,7 +455,8 @@ class LicenseManager:
         """
         Validate the format of a license key.
 
-        Expected format: XXXX-XXXX-XXXX-XXXX (16 alphanumeric characters)
+        Expected format: XXXX-XXXX-XXXX-XXXX (16 alphanumeric characters;
+        dashes and letter case are not significant)
 
         Args:
             key: License key to validate
@@ -259,18 +464,7 @@ class LicenseManager:
         Returns:
             bool: True if format is valid
         """
-        # Remove dashes
-        key_clean = key.replace("-", "")
-
-        # Should be 16 characters
-        if len(key_clean) != 16:
-            return False
-
-        # Should be alphanumeric
-        if not key_clean.isalnum():
-            return False
-
-        return True
+        return _KEY_RE.fullmatch(key.replace("-", "").upper()) is not None
 
     @retry(
         max_attempts=3,
@@ -291,7 +485,8 @@ class LicenseManager:
         Raises:
             NetworkError: If network operation fails after retries
         """
-        logger.debug(f"Validating license with backend: {self._mask_license_key(license_key)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating license with backend: %s", self._mask_license_key(license_key))
 
         # TODO: Implement actual Supabase validation
         # This would make an API call to Supabase:
@@ -304,22 +499,13 @@ class LicenseManager:
 
         # For now, use mock validation for testing
         try:
-            # Simulate network request
-            import time
-            time.sleep(0.1)  # Simulate API delay
-
             # Mock: Accept any key that starts with "PRO-"
             if license_key.startswith("PRO-"):
                 logger.debug("Mock validation: PRO key accepted")
                 return True, "License validated successfully"
 
             # Mock: Accept specific test keys
-            test_keys = [
-                "TEST-1234-5678-ABCD",
-                "DEMO-ABCD-1234-EFGH",
-            ]
-
-            if license_key in test_keys:
+            if license_key in _TEST_KEYS:
                 logger.debug("Mock validation: Test key accepted")
                 return True, "License validated successfully"
 
@@ -333,14 +519,81 @@ class LicenseManager:
                 user_message="Cannot connect to license server. Check your internet connection."
             )
 
-    def _validate_stored_license(self) -> Tuple[bool, str]:
+    def _backend_cache_key(self, license_key: str) -> str:
+        """Settings key for the cached backend result of a license key on this machine."""
+        digest = hashlib.sha256(f"{license_key}|{self.hardware_id}".encode()).hexdigest()
+        return f"license/backend_cache/{digest}"
+
+    def _cached_backend_result(self, license_key: str) -> Optional[Tuple[bool, str]]:
+        """
+        Get a cached successful backend validation for a license key.
+
+        Uses its own QSettings object, as it may run on a worker thread.
+        An expired entry is removed.
+
+        Args:
+            license_key: License key that was validated
+
+        Returns:
+            Optional[Tuple[bool, str]]: (True, message), or None if not cached or expired
+        """
+        settings = QSettings("RealTerrainStudio", "QGIS")
+        cache_key = self._backend_cache_key(license_key)
+        settings.beginGroup(cache_key)
+        try:
+            expires = settings.value("expires", 0, type=float)
+            message = settings.value("message", "")
+        finally:
+            settings.endGroup()
+
+        if time.time() >= expires:
+            if expires:
+                settings.remove(cache_key)
+            return None
+
+        return True, message
+
+    def _cache_backend_result(self, license_key: str, message: str):
+        """
+        Cache a successful backend validation for BACKEND_CACHE_TTL seconds.
+
+        Expired entries of other keys are pruned at the same time, so the
+        cache only ever holds results from the last BACKEND_CACHE_TTL.
+
+        Args:
+            license_key: License key that was validated
+            message: Message returned by the backend
+        """
+        settings = QSettings("RealTerrainStudio", "QGIS")
+        now = time.time()
+
+        settings.beginGroup("license/backend_cache")
+        try:
+            for entry in settings.childGroups():
+                if settings.value(f"{entry}/expires", 0, type=float) <= now:
+                    settings.remove(entry)
+        finally:
+            settings.endGroup()
+
+        settings.beginGroup(self._backend_cache_key(license_key))
+        try:
+            settings.setValue("expires", now + BACKEND_CACHE_TTL)
+            settings.setValue("message", message)
+        finally:
+            settings.endGroup()
+
+    def _validate_stored_license(self, license_key: Optional[str] = None) -> Tuple[bool, str]:
         """
         Validate the stored license.
 
+        Args:
+            license_key: The stored key, if already read; read from settings otherwise
+
         Returns:
             Tuple[bool, str]: (is_valid, status)
         """
-        license_key = self.settings.value("license/key", "")
+        if license_key is None:
+            license_key = self.settings.value("license/key", "")
 
         if not license_key:
             return False, LicenseStatus.NOT_ACTIVATED
@@ -360,18 +613,30 @@ class LicenseManager:
         Args:
             license_key: License key to store
         """
-        self.settings.setValue("license/key", license_key)
-        self.settings.setValue("license/activated_date", datetime.now().isoformat())
-        self.settings.setValue("license/hardware_id", self.hardware_id)
-
-        # TODO: Store user email from backend response
-        self.settings.setValue("license/user_email", "user@example.com")
+        # Resolved before entering the group, as it may read settings itself
+        hardware_id = self.hardware_id
 
+        self.settings.beginGroup("license")
+        try:
+            for k, v in (
+                ("key", license_key),
+                ("activated_date", time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())),
+                ("hardware_id", hardware_id),
+                # TODO: Store user email from backend response
+                ("user_email", "user@example.com"),
+            ):
+                self.settings.setValue(k, v)
+        finally:
+            self.settings.endGroup()
+
+        # Flushed right away so an activation survives a QGIS crash
         self.settings.sync()
 
-    def _mask_license_key(self, key: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _mask_license_key(key: str) -> str:
         """
-        Mask a license key for display.
+        Mask a license key for display (cached, as the same few keys recur).
 
         Args:
             key: License key to mask
@@ -398,13 +663,16 @@ class LicenseManager:
         """
         Check if this is the first run of the plugin.
 
+        Reflects the flag as read when the manager was created, plus any
+        mark_first_run_complete() call on this manager.
+
         Returns:
             bool: True if first run
         """
-        first_run = self.settings.value("app/first_run", True, type=bool)
-        return first_run
+        return self._first_run
 
     def mark_first_run_complete(self):
         """Mark that the first run has been completed."""
+        # Not synced explicitly; Qt writes it out on its next flush or on exit
         self.settings.setValue("app/first_run", False)
-        self.settings.sync()
+        self._first_run = False
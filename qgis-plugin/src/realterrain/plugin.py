@@ -11,12 +11,14 @@ It handles:
 Author: RealTerrain Studio
 """
 
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication
+from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, QTimer
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction
 from qgis.core import QgsMessageLog, Qgis
 
 import os.path
+import threading
+from functools import cached_property
 
 
 class RealTerrainPlugin:
@@ -48,10 +50,6 @@ class RealTerrainPlugin:
         self.pluginIsActive = False
         self.dockwidget = None
 
-        # Initialize license manager
-        from .licensing.license_manager import LicenseManager
-        self.license_manager = LicenseManager()
-
         # Log that plugin initialized
         QgsMessageLog.logMessage(
             'RealTerrain Studio Plugin Initialized',
@@ -59,6 +57,17 @@ class RealTerrainPlugin:
             Qgis.Info
         )
 
+    @cached_property
+    def license_manager(self):
+        """
+        License manager, created on first use.
+
+        Importing the licensing module and fingerprinting the hardware are
+        kept out of plugin loading so they don't slow down QGIS startup.
+        """
+        from .licensing.license_manager import LicenseManager
+        return LicenseManager()
+
     def add_action(
         self,
         icon_path,
@@ -148,9 +157,13 @@ class RealTerrainPlugin:
             Qgis.Info
         )
 
-        # Show license dialog on first run
-        if self.license_manager.is_first_run():
-            self._show_first_run_license_dialog()
+        # Compute the hardware fingerprint off the GUI thread; the license
+        # manager picks up the cached result when it is first used
+        from .licensing.hardware_fingerprint import get_hardware_fingerprint
+        threading.Thread(target=get_hardware_fingerprint, daemon=True).start()
+
+        # Check for first run once QGIS has finished starting up
+        QTimer.singleShot(0, self._check_first_run)
 
     def unload(self):
         """
@@ -179,6 +192,11 @@ class RealTerrainPlugin:
         dialog = LicenseDialog(self.iface.mainWindow(), show_continue_free=False)
         dialog.exec_()
 
+    def _check_first_run(self):
+        """Show the license dialog if this is the first run."""
+        if self.license_manager.is_first_run():
+            self._show_first_run_license_dialog()
+
     def _show_first_run_license_dialog(self):
         """Show license dialog on first run."""
         from .ui.license_dialog import LicenseDialog
@@ -4,19 +4,117 @@ License Activation Dialog
 UI for license key activation and management.
 """
 
-from qgis.PyQt.QtCore import Qt
+from collections import defaultdict
+from functools import cached_property
+
+from qgis.PyQt.QtCore import Qt, QTimer
 from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QTextEdit, QFrame, QGroupBox, QTabWidget, QWidget
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QLineEdit, QFrame, QGroupBox, QTabWidget, QWidget, QMessageBox
 )
 from qgis.PyQt.QtGui import QFont
 
 from ..licensing.license_manager import LicenseManager, LicenseStatus
 
+# Pro feature list shown on the activation tab
+_PRO_FEATURES_HTML = """
+<ul>
+    <li><b>Unlimited area exports</b> - No size restrictions</li>
+    <li><b>Unlimited monthly exports</b> - Export as much as you need</li>
+    <li><b>Highest resolution</b> - Up to 1m elevation and imagery</li>
+    <li><b>All special features</b> - Tactical analysis, fortifications, etc.</li>
+    <li><b>Priority support</b> - Fast response times</li>
+    <li><b>Commercial use</b> - Use in commercial projects</li>
+</ul>
+"""
+
+# Activation status label styles
+_STYLE_ERR = "color: red;"
+_STYLE_OK = "color: green;"
+
+# Status and limits text, filled from get_license_info() (missing fields show N/A)
+_STATUS_TMPL = """
+<h3>License Status: {tier}</h3>
+<p>{message}</p>
+<p><b>Hardware ID:</b> {hardware_id}</p>
+"""
+_STATUS_TMPL_PRO = """
+<h3>License Status: {tier}</h3>
+<p>{message}</p>
+<p><b>License Key:</b> {license_key}</p>
+<p><b>Activated:</b> {activated_date}</p>
+<p><b>Email:</b> {user_email}</p>
+<p><b>Hardware ID:</b> {hardware_id}</p>
+"""
+_LIMITS_TMPL = (
+    "<ul>"
+    "<li><b>Area limit:</b> {area}</li>"
+    "<li><b>Monthly exports:</b> {monthly}</li>"
+    "<li><b>Max resolution:</b> {res}</li>"
+    "</ul>"
+)
+
+
+def _fmt_limit(value, unit: str = "") -> str:
+    """Format a tier limit; text values such as "Unlimited" get no unit."""
+    if value is None:
+        return "N/A"
+    if isinstance(value, str):
+        return value
+    return f"{value}{unit}"
+
+
+def _build_group(parent_layout, title: str, items) -> QGroupBox:
+    """
+    Add a titled group box to a layout.
+
+    Args:
+        parent_layout: Layout the group is added to
+        title: Group box title
+        items: Widgets and layouts to stack vertically inside the group
+
+    Returns:
+        QGroupBox: The added group
+    """
+    group = QGroupBox(title)
+    group_layout = QVBoxLayout()
+    for item in items:
+        if isinstance(item, QWidget):
+            group_layout.addWidget(item)
+        else:
+            group_layout.addLayout(item)
+    group.setLayout(group_layout)
+    parent_layout.addWidget(group)
+    return group
+
+
+def _row(*widgets) -> QHBoxLayout:
+    """Lay widgets out side by side; None adds a stretch."""
+    row = QHBoxLayout()
+    for widget in widgets:
+        if widget is None:
+            row.addStretch()
+        else:
+            row.addWidget(widget)
+    return row
+
+
+def _rich_label(text: str = "", selectable: bool = True) -> QLabel:
+    """Create a word-wrapped rich-text label."""
+    label = QLabel(text)
+    label.setTextFormat(Qt.RichText)
+    label.setWordWrap(True)
+    if selectable:
+        label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+    return label
+
 
 class LicenseDialog(QDialog):
     """Dialog for license activation and information."""
 
+    # Header font, built on first use and shared by all dialogs
+    _HEADER_FONT = None
+
     def __init__(self, parent=None, show_continue_free=True):
         """
         Initialize the license dialog.
@@ -26,15 +124,23 @@ class LicenseDialog(QDialog):
             show_continue_free: If True, shows "Continue with Free" button
         """
         super().__init__(parent)
-        self.license_manager = LicenseManager()
         self.show_continue_free = show_continue_free
+        # Running ValidateLicenseTask, if any; held so its result can be
+        # disconnected when the dialog closes first
+        self._activation_task = None
+        self._clipboard = QApplication.clipboard()
+        self._last_rendered = None  # (status, limits) text last shown on the status tab
 
         self.setWindowTitle("RealTerrain Studio - License Activation")
         self.setMinimumSize(600, 500)
         self.setModal(True)
 
         self._init_ui()
-        self._load_current_status()
+
+    @cached_property
+    def license_manager(self) -> LicenseManager:
+        """License manager, created on first use."""
+        return LicenseManager()
 
     def _init_ui(self):
         """Initialize the user interface."""
@@ -44,10 +150,12 @@ class LicenseDialog(QDialog):
 
         # Header
         header_label = QLabel("License Activation")
-        header_font = QFont()
-        header_font.setPointSize(16)
-        header_font.setBold(True)
-        header_label.setFont(header_font)
+        if LicenseDialog._HEADER_FONT is None:
+            header_font = QFont()
+            header_font.setPointSize(16)
+            header_font.setBold(True)
+            LicenseDialog._HEADER_FONT = header_font
+        header_label.setFont(LicenseDialog._HEADER_FONT)
         header_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(header_label)
 
@@ -58,9 +166,14 @@ class LicenseDialog(QDialog):
         self.activation_tab = self._create_activation_tab()
         self.tab_widget.addTab(self.activation_tab, "Activate")
 
-        # Status tab
-        self.status_tab = self._create_status_tab()
+        # Status tab, filled in the first time it is shown
+        self.status_tab = QWidget()
+        status_tab_layout = QVBoxLayout()
+        status_tab_layout.setContentsMargins(0, 0, 0, 0)
+        self.status_tab.setLayout(status_tab_layout)
+        self._status_tab_built = False
         self.tab_widget.addTab(self.status_tab, "License Info")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         layout.addWidget(self.tab_widget)
 
@@ -100,81 +213,52 @@ class LicenseDialog(QDialog):
         layout.addWidget(desc_label)
 
         # License key input
-        key_group = QGroupBox("License Key")
-        key_layout = QVBoxLayout()
-
-        key_input_layout = QHBoxLayout()
         self.license_key_input = QLineEdit()
         self.license_key_input.setPlaceholderText("XXXX-XXXX-XXXX-XXXX")
         self.license_key_input.setMaxLength(19)  # 16 chars + 3 dashes
-        key_input_layout.addWidget(self.license_key_input)
 
         self.activate_button = QPushButton("Activate")
         self.activate_button.setMinimumWidth(100)
         self.activate_button.clicked.connect(self._on_activate)
-        key_input_layout.addWidget(self.activate_button)
-
-        key_layout.addLayout(key_input_layout)
 
         # Status message
         self.activation_status_label = QLabel("")
         self.activation_status_label.setWordWrap(True)
-        key_layout.addWidget(self.activation_status_label)
 
-        key_group.setLayout(key_layout)
-        layout.addWidget(key_group)
+        _build_group(layout, "License Key", (
+            _row(self.license_key_input, self.activate_button),
+            self.activation_status_label,
+        ))
 
         # Hardware ID display
-        hw_group = QGroupBox("Hardware ID")
-        hw_layout = QVBoxLayout()
-
         hw_desc = QLabel(
             "Your Hardware ID is required for license activation. "
             "Copy this ID when purchasing a license."
         )
         hw_desc.setWordWrap(True)
-        hw_layout.addWidget(hw_desc)
 
-        hw_id_layout = QHBoxLayout()
-        self.hardware_id_label = QLabel(self.license_manager.hardware_id)
+        # Filled in once the dialog is up, see _populate_hardware_id
+        self.hardware_id_label = QLabel("Computing…")
+        QTimer.singleShot(0, self._populate_hardware_id)
         self.hardware_id_label.setStyleSheet(
             "background-color: #f0f0f0; padding: 5px; "
             "font-family: monospace; border: 1px solid #ccc;"
         )
         self.hardware_id_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        hw_id_layout.addWidget(self.hardware_id_label)
 
         copy_button = QPushButton("Copy")
         copy_button.setMaximumWidth(70)
         copy_button.clicked.connect(self._on_copy_hardware_id)
-        hw_id_layout.addWidget(copy_button)
 
-        hw_layout.addLayout(hw_id_layout)
-
-        hw_group.setLayout(hw_layout)
-        layout.addWidget(hw_group)
+        _build_group(layout, "Hardware ID", (
+            hw_desc,
+            _row(self.hardware_id_label, copy_button),
+        ))
 
         # Pro features
-        features_group = QGroupBox("Pro Features")
-        features_layout = QVBoxLayout()
-
-        features_text = QTextEdit()
-        features_text.setReadOnly(True)
-        features_text.setMaximumHeight(150)
-        features_text.setHtml("""
-            <ul>
-                <li><b>Unlimited area exports</b> - No size restrictions</li>
-                <li><b>Unlimited monthly exports</b> - Export as much as you need</li>
-                <li><b>Highest resolution</b> - Up to 1m elevation and imagery</li>
-                <li><b>All special features</b> - Tactical analysis, fortifications, etc.</li>
-                <li><b>Priority support</b> - Fast response times</li>
-                <li><b>Commercial use</b> - Use in commercial projects</li>
-            </ul>
-        """)
-        features_layout.addWidget(features_text)
-
-        features_group.setLayout(features_layout)
-        layout.addWidget(features_group)
+        _build_group(layout, "Pro Features", (
+            _rich_label(_PRO_FEATURES_HTML, selectable=False),
+        ))
 
         layout.addStretch()
 
@@ -188,107 +272,86 @@ class LicenseDialog(QDialog):
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
 
-        # Status display
-        status_group = QGroupBox("Current License Status")
-        status_layout = QVBoxLayout()
-
-        self.status_text = QTextEdit()
-        self.status_text.setReadOnly(True)
-        self.status_text.setMaximumHeight(200)
-
-        status_layout.addWidget(self.status_text)
-
-        # Deactivate button
-        deactivate_layout = QHBoxLayout()
-        deactivate_layout.addStretch()
+        # Status display, with the deactivate button right-aligned below
+        self.status_text = _rich_label()
 
         self.deactivate_button = QPushButton("Deactivate License")
         self.deactivate_button.setMaximumWidth(150)
         self.deactivate_button.clicked.connect(self._on_deactivate)
-        deactivate_layout.addWidget(self.deactivate_button)
-
-        status_layout.addLayout(deactivate_layout)
 
-        status_group.setLayout(status_layout)
-        layout.addWidget(status_group)
+        _build_group(layout, "Current License Status", (
+            self.status_text,
+            _row(None, self.deactivate_button),
+        ))
 
         # Free tier limits (if applicable)
-        limits_group = QGroupBox("Current Limits")
-        limits_layout = QVBoxLayout()
-
-        self.limits_text = QTextEdit()
-        self.limits_text.setReadOnly(True)
-        self.limits_text.setMaximumHeight(150)
-
-        limits_layout.addWidget(self.limits_text)
-
-        limits_group.setLayout(limits_layout)
-        layout.addWidget(limits_group)
+        self.limits_text = _rich_label()
+        _build_group(layout, "Current Limits", (self.limits_text,))
 
         # Purchase link
-        purchase_group = QGroupBox("Get a License")
-        purchase_layout = QVBoxLayout()
-
         purchase_label = QLabel(
             'Visit <a href="https://realterrainstudio.com/pricing">realterrainstudio.com/pricing</a> '
             'to purchase a Pro license.'
         )
         purchase_label.setOpenExternalLinks(True)
         purchase_label.setWordWrap(True)
-        purchase_layout.addWidget(purchase_label)
-
-        purchase_group.setLayout(purchase_layout)
-        layout.addWidget(purchase_group)
+        _build_group(layout, "Get a License", (purchase_label,))
 
         layout.addStretch()
 
         widget.setLayout(layout)
         return widget
 
-    def _load_current_status(self):
-        """Load and display current license status."""
-        info = self.license_manager.get_license_info()
-
-        # Update status text
-        status_html = f"""
-            <h3>License Status: {info['tier']}</h3>
-            <p>{info['message']}</p>
-        """
+    def _populate_hardware_id(self):
+        """Show the hardware ID (fingerprinted on first access)."""
+        self.hardware_id_label.setText(self.license_manager.hardware_id)
+
+    def _on_tab_changed(self, index: int):
+        """Build the status tab the first time it is shown."""
+        if self.tab_widget.widget(index) is self.status_tab and not self._status_tab_built:
+            # Build and fill the tab in one go, then repaint once (unless
+            # a caller such as _on_validation_finished already holds updates)
+            updates_enabled = self.updatesEnabled()
+            self.setUpdatesEnabled(False)
+            try:
+                self.status_tab.layout().addWidget(self._create_status_tab())
+                self._status_tab_built = True
+                self._load_current_status()
+            finally:
+                self.setUpdatesEnabled(updates_enabled)
 
-        if info['status'] == LicenseStatus.PRO:
-            status_html += f"""
-                <p><b>License Key:</b> {info.get('license_key', 'N/A')}</p>
-                <p><b>Activated:</b> {info.get('activated_date', 'N/A')}</p>
-                <p><b>Email:</b> {info.get('user_email', 'N/A')}</p>
-            """
-            self.deactivate_button.setEnabled(True)
-        else:
-            self.deactivate_button.setEnabled(False)
-
-        status_html += f"""
-            <p><b>Hardware ID:</b> {info['hardware_id']}</p>
-        """
+    def _load_current_status(self):
+        """Load and display current license status (once the status tab exists)."""
+        if not self._status_tab_built:
+            return
 
-        self.status_text.setHtml(status_html)
+        info = self.license_manager.get_license_info()
 
-        # Update limits text
         limits = info.get('limits', {})
-        limits_html = "<ul>"
-
-        if isinstance(limits.get('max_area_km2'), str):
-            limits_html += f"<li><b>Area limit:</b> {limits['max_area_km2']}</li>"
-        else:
-            limits_html += f"<li><b>Area limit:</b> {limits.get('max_area_km2', 'N/A')} km²</li>"
+        rendered = (
+            self._render_status_html(info),
+            _LIMITS_TMPL.format(
+                area=_fmt_limit(limits.get('max_area_km2'), " km²"),
+                monthly=_fmt_limit(limits.get('monthly_exports')),
+                res=_fmt_limit(limits.get('max_resolution_m')),
+            ),
+        )
 
-        if isinstance(limits.get('monthly_exports'), str):
-            limits_html += f"<li><b>Monthly exports:</b> {limits['monthly_exports']}</li>"
-        else:
-            limits_html += f"<li><b>Monthly exports:</b> {limits.get('monthly_exports', 'N/A')}</li>"
+        # Nothing to redraw if the text shown is still current
+        if rendered == self._last_rendered:
+            return
+        self._last_rendered = rendered
 
-        limits_html += f"<li><b>Max resolution:</b> {limits.get('max_resolution_m', 'N/A')}</li>"
-        limits_html += "</ul>"
+        # Update status and limits text
+        status_html, limits_html = rendered
+        self.status_text.setText(status_html)
+        self.deactivate_button.setEnabled(info['status'] == LicenseStatus.PRO)
+        self.limits_text.setText(limits_html)
 
-        self.limits_text.setHtml(limits_html)
+    def _render_status_html(self, info: dict) -> str:
+        """Build the status text for license info from get_license_info()."""
+        template = _STATUS_TMPL_PRO if info['status'] == LicenseStatus.PRO else _STATUS_TMPL
+        return template.format_map(defaultdict(lambda: 'N/A', info))
 
     def _on_activate(self):
         """Handle activate button click."""
@@ -296,53 +359,92 @@ class LicenseDialog(QDialog):
 
         if not license_key:
             self.activation_status_label.setText("❌ Please enter a license key")
-            self.activation_status_label.setStyleSheet("color: red;")
+            self.activation_status_label.setStyleSheet(_STYLE_ERR)
             return
 
-        # Attempt activation
-        success, message = self.license_manager.activate_license(license_key)
+        # Validate with the backend on a worker thread; the result comes
+        # back through _on_validation_finished
+        from qgis.PyQt.QtCore import QThreadPool
+        from ..licensing.activation_task import ValidateLicenseTask
 
-        if success:
-            self.activation_status_label.setText(f"✅ {message}")
-            self.activation_status_label.setStyleSheet("color: green;")
-            self.license_key_input.clear()
+        self.activate_button.setEnabled(False)
+        self.activation_status_label.setText("⏳ Validating license...")
+        self.activation_status_label.setStyleSheet("")
+
+        task = ValidateLicenseTask(self.license_manager, license_key)
+        task.signals.finished.connect(self._on_validation_finished)
+        self._activation_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def done(self, result: int):
+        """Close the dialog, ignoring a validation still in progress."""
+        if self._activation_task is not None:
+            self._activation_task.signals.finished.disconnect(self._on_validation_finished)
+            self._activation_task = None
+        super().done(result)
 
-            # Reload status
-            self._load_current_status()
+    def _on_validation_finished(self, license_key: str, success: bool, message: str):
+        """Store a validated license key and show the activation result."""
+        self._activation_task = None
+        self.activate_button.setEnabled(True)
 
-            # Switch to status tab
-            self.tab_widget.setCurrentIndex(1)
+        if success:
+            success, message = self.license_manager.store_activated_license(license_key)
+
+        if success:
+            # Repaint once for all of the changes below
+            self.setUpdatesEnabled(False)
+            try:
+                self.activation_status_label.setText(f"✅ {message}")
+                self.activation_status_label.setStyleSheet(_STYLE_OK)
+                self.license_key_input.clear()
+
+                # Reload status
+                self._load_current_status()
+
+                # Switch to status tab
+                self.tab_widget.setCurrentIndex(1)
+            finally:
+                self.setUpdatesEnabled(True)
         else:
             self.activation_status_label.setText(f"❌ {message}")
-            self.activation_status_label.setStyleSheet("color: red;")
+            self.activation_status_label.setStyleSheet(_STYLE_ERR)
 
     def _on_deactivate(self):
         """Handle deactivate button click."""
-        from qgis.PyQt.QtWidgets import QMessageBox
-
-        reply = QMessageBox.question(
-            self,
-            "Deactivate License",
-            "Are you sure you want to deactivate your license?\n"
-            "You will need to re-enter your license key to reactivate.",
-            QMessageBox.Yes | QMessageBox.No
-        )
+        reply = self._deactivate_confirm.exec_()
 
         if reply == QMessageBox.Yes:
             self.license_manager.deactivate_license()
-            self._load_current_status()
-            self.activation_status_label.setText("✅ License deactivated")
-            self.activation_status_label.setStyleSheet("color: green;")
+
+            # Repaint once for all of the changes below
+            self.setUpdatesEnabled(False)
+            try:
+                self._load_current_status()
+                self.activation_status_label.setText("✅ License deactivated")
+                self.activation_status_label.setStyleSheet(_STYLE_OK)
+            finally:
+                self.setUpdatesEnabled(True)
+
+    @cached_property
+    def _deactivate_confirm(self) -> QMessageBox:
+        """Deactivation confirmation box, built on first use and reused."""
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Question)
+        box.setWindowTitle("Deactivate License")
+        box.setText(
+            "Are you sure you want to deactivate your license?\n"
+            "You will need to re-enter your license key to reactivate."
+        )
+        box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        return box
 
     def _on_copy_hardware_id(self):
         """Copy hardware ID to clipboard."""
-        from qgis.PyQt.QtWidgets import QApplication
-
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.license_manager.hardware_id)
+        self._clipboard.setText(self.license_manager.hardware_id)
 
         self.activation_status_label.setText("✅ Hardware ID copied to clipboard")
-        self.activation_status_label.setStyleSheet("color: green;")
+        self.activation_status_label.setStyleSheet(_STYLE_OK)
 
     def _on_continue_free(self):
         """Handle continue with free version."""
@@ -184,6 +184,103 @@ def test_json_export():
         return False
 
 
+def test_jsonseq_export():
+    """Test line-delimited JSON feature stream export."""
+    print("\n" + "="*60)
+    print("Test: JSON Sequence Export")
+    print("="*60)
+
+    try:
+        # Create mock data
+        ue5_data = create_mock_ue5_data()
+        bbox = (-122.5, 37.7, -122.4, 37.8)
+
+        # Export
+        exporter = OSMExporter()
+        seq_path = 'test_osm_objects.jsonl'
+
+        print("\nExporting to JSON sequence...")
+        exporter.export_jsonseq(ue5_data, seq_path, bbox)
+
+        # Read back one line at a time
+        with open(seq_path, 'r', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+
+        metadata, features = lines[0], lines[1:]
+
+        print(f"\n✅ JSON sequence created: {seq_path}")
+        print(f"  Lines: {len(lines)} (1 metadata + {len(features)} features)")
+
+        assert metadata['counts']['buildings'] == 2
+        assert metadata['counts']['roads'] == 2
+        assert metadata['counts']['pois'] == 3
+
+        categories = [feature['category'] for feature in features]
+        assert categories.count('roads') == 2
+        assert categories.count('buildings') == 2
+        assert categories.count('pois') == 3
+
+        # Clean up
+        os.remove(seq_path)
+
+        print("\n✅ JSON sequence export test passed!")
+        return True
+
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_shared_tags_export():
+    """Test JSON export with a shared tag pool."""
+    print("\n" + "="*60)
+    print("Test: Shared Tags Export")
+    print("="*60)
+
+    try:
+        # Create mock data where both buildings share one tag set
+        ue5_data = create_mock_ue5_data()
+        for building in ue5_data['buildings']:
+            building['tags'] = {'building': 'yes'}
+        bbox = (-122.5, 37.7, -122.4, 37.8)
+
+        # Export
+        exporter = OSMExporter()
+        json_path = 'test_osm_shared_tags.json'
+
+        print("\nExporting to JSON with shared tags...")
+        exporter.export_json(ue5_data, json_path, bbox, share_tags=True)
+
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        tag_pool = data['tag_pool']
+        print(f"\n✅ JSON created: {json_path}")
+        print(f"  Tag pool entries: {len(tag_pool)}")
+
+        # 2 roads + 1 shared building tag set + 3 POIs
+        assert len(tag_pool) == 6
+
+        refs = [building['tag_ref'] for building in data['buildings']]
+        assert refs[0] == refs[1]
+        assert tag_pool[refs[0]] == {'building': 'yes'}
+        assert all('tags' not in road for road in data['roads'])
+
+        # Clean up
+        os.remove(json_path)
+
+        print("\n✅ Shared tags export test passed!")
+        return True
+
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_csv_export():
     """Test CSV export."""
     print("\n" + "="*60)
@@ -492,6 +589,8 @@ def main():
 
     # Run tests
     results.append(("JSON Export", test_json_export()))
+    results.append(("JSON Sequence Export", test_jsonseq_export()))
+    results.append(("Shared Tags Export", test_shared_tags_export()))
     results.append(("CSV Export", test_csv_export()))
     results.append(("Complete Export", test_complete_export()))
     results.append(("Summary Generation", test_summary_generation()))